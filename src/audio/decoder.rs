@@ -1,5 +1,5 @@
 use std::io::{Read, Seek, SeekFrom};
-use std::sync::Mutex;
+use std::sync::{Mutex, OnceLock};
 
 use anyhow::{Context, Result};
 use symphonia::core::audio::SampleBuffer;
@@ -45,6 +45,13 @@ impl symphonia::core::io::MediaSource for HttpSource {
     }
 }
 
+/// Client shared by every stream, so tracks from the same server reuse its
+/// pooled connections instead of each paying for a new handshake.
+fn stream_client() -> &'static reqwest::blocking::Client {
+    static CLIENT: OnceLock<reqwest::blocking::Client> = OnceLock::new();
+    CLIENT.get_or_init(reqwest::blocking::Client::new)
+}
+
 pub struct AudioDecoder {
     format_reader: Box<dyn FormatReader>,
     decoder: Box<dyn Decoder>,
@@ -52,11 +59,16 @@ pub struct AudioDecoder {
     sample_rate: u32,
     channels: usize,
     duration_secs: Option<f64>,
+    /// Packet decoded by `prime`, handed out by the next `next_packet`.
+    primed: Option<Vec<f32>>,
 }
 
 impl AudioDecoder {
     pub fn from_url(url: &str) -> Result<Self> {
-        let response = reqwest::blocking::get(url).context("Failed to fetch audio stream")?;
+        let response = stream_client()
+            .get(url)
+            .send()
+            .context("Failed to fetch audio stream")?;
         let content_length = response.content_length();
 
         let source = HttpSource {
@@ -112,6 +124,7 @@ impl AudioDecoder {
             sample_rate,
             channels,
             duration_secs,
+            primed: None,
         })
     }
 
@@ -127,8 +140,20 @@ impl AudioDecoder {
         self.duration_secs
     }
 
+    /// Decode the first packet ahead of playback, to check that a stream
+    /// opened a while ago still delivers audio. Returns false if it doesn't.
+    pub fn prime(&mut self) -> bool {
+        if self.primed.is_none() {
+            self.primed = self.next_packet();
+        }
+        self.primed.is_some()
+    }
+
     /// Decode the next packet, returning interleaved f32 samples.
     pub fn next_packet(&mut self) -> Option<Vec<f32>> {
+        if let Some(samples) = self.primed.take() {
+            return Some(samples);
+        }
         loop {
             let packet = match self.format_reader.next_packet() {
                 Ok(p) => p,
@@ -165,6 +190,7 @@ impl AudioDecoder {
             .seek(SeekMode::Coarse, seek_to)
             .context("Seek failed")?;
         self.decoder.reset();
+        self.primed = None;
         Ok(())
     }
 }
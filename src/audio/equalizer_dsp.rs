@@ -1,11 +1,25 @@
 use std::f64::consts::PI;
 
 /// 18-band EQ frequencies in Hz.
-pub const EQ_FREQUENCIES: [f64; 18] = [
-    65.0, 92.0, 131.0, 185.0, 262.0, 370.0, 523.0, 740.0, 1047.0, 1480.0, 2093.0, 2960.0, 4186.0,
-    5920.0, 8372.0, 11840.0, 16744.0, 20000.0,
+pub const EQ_BANDS: [u32; 18] = [
+    65, 92, 131, 185, 262, 370, 523, 740, 1047, 1480, 2093, 2960, 4186, 5920, 8372, 11840, 16744,
+    20000,
 ];
 
+pub const GAIN_MIN: f64 = -12.0;
+pub const GAIN_MAX: f64 = 12.0;
+
+/// 18-band EQ frequencies in Hz, as floats for the filter math.
+pub const EQ_FREQUENCIES: [f64; 18] = {
+    let mut freqs = [0.0; 18];
+    let mut i = 0;
+    while i < EQ_BANDS.len() {
+        freqs[i] = EQ_BANDS[i] as f64;
+        i += 1;
+    }
+    freqs
+};
+
 /// A second-order biquad filter using Direct Form I.
 #[derive(Clone)]
 struct BiquadFilter {
@@ -97,6 +111,8 @@ pub struct EqualizerDsp {
     /// filters[channel][band]
     filters: Vec<Vec<BiquadFilter>>,
     gains: [f64; 18],
+    /// All gains are 0 dB, so processing would leave samples unchanged.
+    flat: bool,
     sample_rate: f64,
     channels: usize,
     enabled: bool,
@@ -109,6 +125,7 @@ impl EqualizerDsp {
         let mut dsp = Self {
             filters: Vec::new(),
             gains: [0.0; 18],
+            flat: true,
             sample_rate: sample_rate as f64,
             channels,
             enabled: true,
@@ -118,15 +135,21 @@ impl EqualizerDsp {
     }
 
     pub fn set_gains(&mut self, gains: &[f64]) {
-        for (i, &g) in gains.iter().take(18).enumerate() {
-            self.gains[i] = g.clamp(-12.0, 12.0);
+        let previous = self.gains;
+        for (gain, &g) in self.gains.iter_mut().zip(gains) {
+            *gain = g.clamp(GAIN_MIN, GAIN_MAX);
         }
-        // Update coefficients in-place to preserve filter state (smooth transition)
+        self.flat = self.gains.iter().all(|&g| g == 0.0);
+        // Update coefficients in-place to preserve filter state (smooth transition).
+        // Moving one slider changes one band, so only that band is recomputed
         if self.filters.is_empty() {
             self.rebuild_filters();
         } else {
-            for ch_filters in &mut self.filters {
-                for (i, &freq) in EQ_FREQUENCIES.iter().enumerate() {
+            for (i, &freq) in EQ_FREQUENCIES.iter().enumerate() {
+                if self.gains[i] == previous[i] {
+                    continue;
+                }
+                for ch_filters in &mut self.filters {
                     ch_filters[i].update_coefficients(
                         freq,
                         self.gains[i],
@@ -147,21 +170,18 @@ impl EqualizerDsp {
 
     /// Process interleaved f32 samples in-place.
     pub fn process(&mut self, samples: &mut [f32]) {
-        if !self.enabled || self.gains.iter().all(|&g| g == 0.0) {
+        if !self.enabled || self.flat {
             return;
         }
 
-        for frame_start in (0..samples.len()).step_by(self.channels) {
-            for ch in 0..self.channels {
-                let idx = frame_start + ch;
-                if idx >= samples.len() {
-                    break;
-                }
-                let mut sample = samples[idx] as f64;
-                for band in 0..18 {
-                    sample = self.filters[ch][band].process(sample);
+        // Walk whole frames so the inner loops need no index bounds checks
+        for frame in samples.chunks_mut(self.channels) {
+            for (sample, ch_filters) in frame.iter_mut().zip(&mut self.filters) {
+                let mut value = *sample as f64;
+                for filter in ch_filters.iter_mut() {
+                    value = filter.process(value);
                 }
-                samples[idx] = sample as f32;
+                *sample = value as f32;
             }
         }
     }
@@ -7,9 +7,36 @@ use super::equalizer_dsp::EqualizerDsp;
 use super::output::AudioOutput;
 use super::resampler::Resampler;
 
+/// Smallest change in position worth reporting to the UI.
+const POSITION_STEP_SECS: f64 = 0.25;
+
+/// Age past which a preloaded stream is reopened rather than trusted; an
+/// idle connection this old may have been dropped by the server.
+pub const PRELOAD_MAX_AGE: Duration = Duration::from_secs(60);
+
+/// How long before the end of a track the next one is preloaded; well
+/// under `PRELOAD_MAX_AGE` so the stream is still fresh when it is needed.
+pub const PRELOAD_LEAD_SECS: f64 = 20.0;
+
+/// Whether playback has reached the point where the next track should be
+/// preloaded: `PRELOAD_LEAD_SECS` before the end, but never in the first
+/// half of a short track.
+pub fn preload_due(position: f64, duration: f64) -> bool {
+    duration > 0.0 && position >= (duration - PRELOAD_LEAD_SECS).max(duration * 0.5)
+}
+
 #[derive(Debug)]
 pub enum AudioCommand {
-    Play { url: String },
+    Play {
+        url: String,
+    },
+    /// Start opening `url` in the background; a later `Play` with the same
+    /// URL picks up the open stream instead of connecting again.
+    Preload {
+        url: String,
+    },
+    /// Drop any preloaded stream, e.g. when switching servers.
+    CancelPreload,
     Pause,
     Resume,
     Stop,
@@ -71,6 +98,43 @@ impl AudioPipeline {
     }
 }
 
+/// A decoder being opened on a helper thread ahead of its `Play`.
+struct Preload {
+    url: String,
+    opened: Instant,
+    rx: mpsc::Receiver<anyhow::Result<AudioDecoder>>,
+}
+
+impl Preload {
+    fn start(url: String) -> Self {
+        let (tx, rx) = mpsc::channel();
+        let thread_url = url.clone();
+        thread::spawn(move || {
+            let _ = tx.send(AudioDecoder::from_url(&thread_url));
+        });
+        Self {
+            url,
+            opened: Instant::now(),
+            rx,
+        }
+    }
+}
+
+/// Open a decoder for `url`, taking over a matching preload if there is one.
+/// A preload for another URL is dropped, and a failed, stale or silent one
+/// is replaced by a fresh connection.
+fn open_decoder(url: &str, preload: Option<Preload>) -> anyhow::Result<AudioDecoder> {
+    if let Some(preload) = preload
+        && preload.url == url
+        && preload.opened.elapsed() < PRELOAD_MAX_AGE
+        && let Ok(Ok(mut dec)) = preload.rx.recv()
+        && dec.prime()
+    {
+        return Ok(dec);
+    }
+    AudioDecoder::from_url(url)
+}
+
 /// Convert interleaved samples between channel counts.
 /// Mono → Stereo: duplicate each sample.
 /// Stereo → Mono: average L+R.
@@ -123,27 +187,45 @@ fn audio_thread(
     let mut eq_enabled = true;
 
     let mut decoder: Option<AudioDecoder> = None;
+    let mut preload: Option<Preload> = None;
     let mut output: Option<AudioOutput> = None;
     let mut eq_dsp: Option<EqualizerDsp> = None;
     let mut resampler: Option<Resampler> = None;
-    let mut last_position_update = Instant::now();
+    let mut frames_since_position: u64 = 0;
+    let mut last_position_sent = f64::NEG_INFINITY;
     let mut total_frames_decoded: u64 = 0;
     let mut dec_channels: usize = 2;
     let mut out_channels: usize = 2;
 
     loop {
-        // Check for commands (non-blocking)
-        while let Ok(cmd) = cmd_rx.try_recv() {
+        // Seeks are deferred until the queue is drained, so holding an arrow
+        // key costs one decoder seek per pass instead of one per key repeat
+        let mut pending_seek: Option<f64> = None;
+
+        // While playing, only take commands that are already waiting; with
+        // nothing to decode, sleep until the next one arrives
+        let first = if state == PlaybackState::Playing && decoder.is_some() {
+            cmd_rx.try_recv().ok()
+        } else {
+            match cmd_rx.recv() {
+                Ok(cmd) => Some(cmd),
+                Err(_) => return,
+            }
+        };
+        for cmd in first.into_iter().chain(cmd_rx.try_iter()) {
             match cmd {
                 AudioCommand::Play { url } => {
                     // Stop current playback
+                    pending_seek = None;
                     decoder = None;
                     output = None;
                     eq_dsp = None;
                     resampler = None;
                     total_frames_decoded = 0;
+                    frames_since_position = 0;
+                    last_position_sent = f64::NEG_INFINITY;
 
-                    match AudioDecoder::from_url(&url) {
+                    match open_decoder(&url, preload.take()) {
                         Ok(dec) => {
                             let dec_rate = dec.sample_rate();
                             dec_channels = dec.channels();
@@ -195,6 +277,12 @@ fn audio_thread(
                         }
                     }
                 }
+                AudioCommand::Preload { url } => {
+                    preload = Some(Preload::start(url));
+                }
+                AudioCommand::CancelPreload => {
+                    preload = None;
+                }
                 AudioCommand::Pause => {
                     if state == PlaybackState::Playing {
                         state = PlaybackState::Paused;
@@ -216,20 +304,19 @@ fn audio_thread(
                     }
                 }
                 AudioCommand::Stop => {
+                    pending_seek = None;
                     decoder = None;
                     output = None;
                     eq_dsp = None;
                     resampler = None;
                     state = PlaybackState::Stopped;
                     total_frames_decoded = 0;
+                    frames_since_position = 0;
+                    last_position_sent = f64::NEG_INFINITY;
                     let _ = event_tx.send(AudioEvent::StateChange(state));
                 }
                 AudioCommand::Seek(pos) => {
-                    if let Some(dec) = &mut decoder {
-                        let _ = dec.seek(pos);
-                        let rate = dec.sample_rate() as u64;
-                        total_frames_decoded = (pos * rate as f64) as u64;
-                    }
+                    pending_seek = Some(pos);
                 }
                 AudioCommand::SetVolume(v) => {
                     volume = v;
@@ -269,71 +356,87 @@ fn audio_thread(
             }
         }
 
+        if let Some(pos) = pending_seek
+            && let Some(dec) = &mut decoder
+        {
+            let _ = dec.seek(pos);
+            let rate = dec.sample_rate() as u64;
+            total_frames_decoded = (pos * rate as f64) as u64;
+            frames_since_position = 0;
+            last_position_sent = f64::NEG_INFINITY;
+        }
+
         // Decode and send audio if playing
-        if state == PlaybackState::Playing {
-            if let (Some(dec), Some(out)) = (&mut decoder, &output) {
-                match dec.next_packet() {
-                    Some(mut samples) => {
-                        let num_frames = samples.len() / dec_channels;
-                        total_frames_decoded += num_frames as u64;
-
-                        // Apply EQ (operates on decoder channel count)
-                        if let Some(dsp) = &mut eq_dsp {
-                            dsp.process(&mut samples);
-                        }
+        if state == PlaybackState::Playing
+            && let (Some(dec), Some(out)) = (&mut decoder, &output)
+        {
+            match dec.next_packet() {
+                Some(mut samples) => {
+                    let num_frames = samples.len() / dec_channels;
+                    total_frames_decoded += num_frames as u64;
+                    frames_since_position += num_frames as u64;
 
-                        // Volume/mute applied in output callback for instant response
+                    // Apply EQ (operates on decoder channel count)
+                    if let Some(dsp) = &mut eq_dsp {
+                        dsp.process(&mut samples);
+                    }
 
-                        // Convert channels if needed (mono→stereo, etc.)
-                        let samples = if dec_channels != out_channels {
-                            convert_channels(&samples, dec_channels, out_channels)
-                        } else {
-                            samples
-                        };
+                    // Volume/mute applied in output callback for instant response
 
-                        // Resample if needed
-                        let final_samples = if let Some(rs) = &mut resampler {
-                            match rs.process(&samples) {
-                                Ok(resampled) => resampled,
-                                Err(e) => {
-                                    let _ = event_tx
-                                        .send(AudioEvent::Error(format!("Resample error: {e}")));
-                                    continue;
-                                }
-                            }
-                        } else {
-                            samples
-                        };
+                    // Convert channels if needed (mono→stereo, etc.)
+                    let samples = if dec_channels != out_channels {
+                        convert_channels(&samples, dec_channels, out_channels)
+                    } else {
+                        samples
+                    };
 
-                        // Send to output (skip empty - resampler may be buffering)
-                        if !final_samples.is_empty() {
-                            let _ = out.sample_sender.send(final_samples);
+                    // Resample if needed
+                    let final_samples = if let Some(rs) = &mut resampler {
+                        match rs.process(&samples) {
+                            Ok(resampled) => resampled,
+                            Err(e) => {
+                                let _ = event_tx
+                                    .send(AudioEvent::Error(format!("Resample error: {e}")));
+                                continue;
+                            }
                         }
+                    } else {
+                        samples
+                    };
+
+                    // Send to output (skip empty - resampler may be buffering)
+                    if !final_samples.is_empty() {
+                        let _ = out.sample_sender.send(final_samples);
+                    }
 
-                        // Periodic position update (~10 Hz)
-                        if last_position_update.elapsed() >= Duration::from_millis(100) {
-                            let position = total_frames_decoded as f64 / dec.sample_rate() as f64;
+                    // Periodic position update, every tenth of a second of
+                    // audio; counted in frames so no clock is read per packet
+                    let rate = dec.sample_rate() as u64;
+                    if frames_since_position * 10 >= rate {
+                        frames_since_position = 0;
+                        let position = total_frames_decoded as f64 / rate as f64;
+                        // Less than a quarter second changes nothing on
+                        // screen; seeks and new tracks reset the last value
+                        // sent, so their first update always gets through
+                        if (position - last_position_sent).abs() >= POSITION_STEP_SECS {
                             let duration = dec.duration_secs().unwrap_or(0.0);
                             let _ =
                                 event_tx.send(AudioEvent::PositionUpdate { position, duration });
-                            last_position_update = Instant::now();
+                            last_position_sent = position;
                         }
                     }
-                    None => {
-                        // Track ended
-                        let _ = event_tx.send(AudioEvent::TrackEnd);
-                        decoder = None;
-                        output = None;
-                        eq_dsp = None;
-                        resampler = None;
-                        state = PlaybackState::Stopped;
-                        let _ = event_tx.send(AudioEvent::StateChange(state));
-                    }
+                }
+                None => {
+                    // Track ended
+                    let _ = event_tx.send(AudioEvent::TrackEnd);
+                    decoder = None;
+                    output = None;
+                    eq_dsp = None;
+                    resampler = None;
+                    state = PlaybackState::Stopped;
+                    let _ = event_tx.send(AudioEvent::StateChange(state));
                 }
             }
-        } else {
-            // Sleep briefly when not playing to avoid busy-waiting
-            thread::sleep(Duration::from_millis(10));
         }
     }
 }
@@ -0,0 +1,100 @@
+use std::borrow::Borrow;
+use std::collections::{HashMap, VecDeque};
+use std::hash::Hash;
+use std::time::{Duration, Instant};
+
+/// Map with a fixed capacity that evicts its oldest entry when full.
+pub struct BoundedCache<K, V> {
+    map: HashMap<K, V>,
+    order: VecDeque<K>,
+    capacity: usize,
+}
+
+impl<K: Eq + Hash + Clone, V> BoundedCache<K, V> {
+    pub fn new(capacity: usize) -> Self {
+        Self {
+            map: HashMap::with_capacity(capacity),
+            order: VecDeque::with_capacity(capacity),
+            capacity: capacity.max(1),
+        }
+    }
+
+    pub fn get<Q>(&self, key: &Q) -> Option<&V>
+    where
+        K: Borrow<Q>,
+        Q: Eq + Hash + ?Sized,
+    {
+        self.map.get(key)
+    }
+
+    pub fn contains<Q>(&self, key: &Q) -> bool
+    where
+        K: Borrow<Q>,
+        Q: Eq + Hash + ?Sized,
+    {
+        self.map.contains_key(key)
+    }
+
+    /// Insert or replace a value. Replacing keeps the entry's original age.
+    pub fn insert(&mut self, key: K, value: V) {
+        if let Some(existing) = self.map.get_mut(&key) {
+            *existing = value;
+            return;
+        }
+        if self.map.len() >= self.capacity
+            && let Some(oldest) = self.order.pop_front()
+        {
+            self.map.remove(&oldest);
+        }
+        self.order.push_back(key.clone());
+        self.map.insert(key, value);
+    }
+
+    pub fn len(&self) -> usize {
+        self.map.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.map.is_empty()
+    }
+
+    pub fn clear(&mut self) {
+        self.map.clear();
+        self.order.clear();
+    }
+}
+
+/// `BoundedCache` whose entries go stale `ttl` after they were inserted.
+pub struct TtlCache<K, V> {
+    entries: BoundedCache<K, (Instant, V)>,
+    ttl: Duration,
+}
+
+impl<K: Eq + Hash + Clone, V> TtlCache<K, V> {
+    pub fn new(capacity: usize, ttl: Duration) -> Self {
+        Self {
+            entries: BoundedCache::new(capacity),
+            ttl,
+        }
+    }
+
+    /// The cached value, if it is still fresh.
+    pub fn get<Q>(&self, key: &Q) -> Option<&V>
+    where
+        K: Borrow<Q>,
+        Q: Eq + Hash + ?Sized,
+    {
+        self.entries
+            .get(key)
+            .filter(|(at, _)| at.elapsed() < self.ttl)
+            .map(|(_, value)| value)
+    }
+
+    pub fn insert(&mut self, key: K, value: V) {
+        self.entries.insert(key, (Instant::now(), value));
+    }
+
+    pub fn clear(&mut self) {
+        self.entries.clear();
+    }
+}
@@ -0,0 +1,111 @@
+use std::path::PathBuf;
+use std::process::ExitCode;
+
+use anyhow::Result;
+use clap::Parser;
+
+use crate::{App, AppConfig};
+
+const ABOUT: &str = "TUI music player for Navidrome";
+
+/// Same text clap renders for `--help`; tests keep the two in step.
+pub const HELP: &str = "\
+TUI music player for Navidrome
+
+Usage: cli-music-player [OPTIONS]
+
+Options:
+      --config-dir <CONFIG_DIR>  Override config directory path
+      --server <SERVER>          Connect to a specific server by name
+  -h, --help                     Print help
+  -V, --version                  Print version
+";
+
+#[derive(Parser)]
+#[command(
+    name = "cli-music-player",
+    version = crate::VERSION,
+    about = ABOUT
+)]
+pub struct Cli {
+    /// Override config directory path
+    #[arg(long)]
+    pub config_dir: Option<PathBuf>,
+
+    /// Connect to a specific server by name
+    #[arg(long)]
+    pub server: Option<String>,
+}
+
+impl Cli {
+    /// Fast path for the flags we actually have. Returns `None` when an
+    /// argument is not understood so clap can report the error.
+    pub fn scan(args: &[String]) -> Option<Self> {
+        let mut cli = Cli {
+            config_dir: None,
+            server: None,
+        };
+        let mut iter = args.iter();
+        while let Some(arg) = iter.next() {
+            if let Some(value) = arg.strip_prefix("--config-dir=") {
+                cli.config_dir = Some(PathBuf::from(value));
+            } else if let Some(value) = arg.strip_prefix("--server=") {
+                cli.server = Some(value.to_string());
+            } else if arg == "--config-dir" {
+                cli.config_dir = Some(PathBuf::from(iter.next()?));
+            } else if arg == "--server" {
+                cli.server = Some(iter.next()?.clone());
+            } else {
+                return None;
+            }
+        }
+        Some(cli)
+    }
+}
+
+/// Entry point behind the `cli-music-player` binary.
+pub fn main() -> Result<ExitCode> {
+    let args: Option<Vec<String>> = std::env::args_os()
+        .skip(1)
+        .map(|arg| arg.into_string().ok())
+        .collect();
+
+    // Answer --version and --help directly; there is nothing to parse or
+    // load for either.
+    if let Some(args) = &args {
+        if args.iter().any(|arg| arg == "-V" || arg == "--version") {
+            println!("cli-music-player {}", crate::VERSION);
+            return Ok(ExitCode::SUCCESS);
+        }
+        if args.iter().any(|arg| arg == "-h" || arg == "--help") {
+            print!("{HELP}");
+            return Ok(ExitCode::SUCCESS);
+        }
+    }
+
+    let cli = args
+        .as_deref()
+        .and_then(Cli::scan)
+        .unwrap_or_else(Cli::parse);
+
+    let mut config = if let Some(dir) = &cli.config_dir {
+        AppConfig::load_from(dir)
+    } else {
+        AppConfig::load()
+    };
+
+    // Resolve --server before App::new() starts the runtime and audio thread
+    if let Some(server_name) = &cli.server {
+        let Some(idx) = config.find_server(server_name) else {
+            eprintln!("Server '{server_name}' not found in config");
+            return Ok(ExitCode::FAILURE);
+        };
+        config.set_active_server(idx);
+    }
+
+    let mut app = App::new(config);
+
+    app.run()?;
+
+    Ok(ExitCode::SUCCESS)
+}
@@ -1,31 +1,62 @@
+use std::sync::OnceLock;
+
 use aes_gcm::aead::{Aead, KeyInit, OsRng};
 use aes_gcm::{AeadCore, Aes256Gcm, Nonce};
 use pbkdf2::pbkdf2_hmac;
-use sha2::Sha256;
+use sha2::{Digest, Sha256};
 
 const SALT: &[u8] = b"cli-music-player-salt-v1";
-const ITERATIONS: u32 = 100_000;
+const LEGACY_ITERATIONS: u32 = 100_000;
+
+/// `hostname:user`, looked up once; the user comes from the environment so
+/// no account lookup is needed.
+fn machine_id() -> &'static str {
+    static MACHINE_ID: OnceLock<String> = OnceLock::new();
+    MACHINE_ID.get_or_init(|| {
+        let username = std::env::var("USER")
+            .or_else(|_| std::env::var("USERNAME"))
+            .unwrap_or_else(|_| "default".to_string());
+        let nodename = hostname::get()
+            .map(|h| h.to_string_lossy().to_string())
+            .unwrap_or_else(|_| "unknown".to_string());
+        format!("{nodename}:{username}")
+    })
+}
 
+/// The machine id is not secret, so stretching it buys nothing; one hash
+/// gives the same key.
 fn derive_key() -> [u8; 32] {
-    let username = std::env::var("USER")
-        .or_else(|_| std::env::var("USERNAME"))
-        .unwrap_or_else(|_| "default".to_string());
-    let nodename = hostname::get()
-        .map(|h| h.to_string_lossy().to_string())
-        .unwrap_or_else(|_| "unknown".to_string());
-    let machine_id = format!("{nodename}:{username}");
+    let mut hasher = Sha256::new();
+    hasher.update(SALT);
+    hasher.update(b"|");
+    hasher.update(machine_id().as_bytes());
+    hasher.finalize().into()
+}
 
+/// Key used before passwords switched to `derive_key`.
+fn derive_legacy_key() -> [u8; 32] {
     let mut key = [0u8; 32];
-    pbkdf2_hmac::<Sha256>(machine_id.as_bytes(), SALT, ITERATIONS, &mut key);
+    pbkdf2_hmac::<Sha256>(machine_id().as_bytes(), SALT, LEGACY_ITERATIONS, &mut key);
     key
 }
 
+/// Cipher for this machine's key, derived once per process.
+fn cipher() -> &'static Aes256Gcm {
+    static CIPHER: OnceLock<Aes256Gcm> = OnceLock::new();
+    CIPHER.get_or_init(|| Aes256Gcm::new(&derive_key().into()))
+}
+
+/// Cipher for passwords saved with the legacy key, only derived if one is
+/// actually read.
+fn legacy_cipher() -> &'static Aes256Gcm {
+    static CIPHER: OnceLock<Aes256Gcm> = OnceLock::new();
+    CIPHER.get_or_init(|| Aes256Gcm::new(&derive_legacy_key().into()))
+}
+
 /// Encrypt a password for config storage. Returns base64-encoded nonce+ciphertext.
 pub fn encrypt_password(password: &str) -> String {
-    let key = derive_key();
-    let cipher = Aes256Gcm::new_from_slice(&key).expect("valid key size");
     let nonce = Aes256Gcm::generate_nonce(&mut OsRng);
-    let ciphertext = cipher
+    let ciphertext = cipher()
         .encrypt(&nonce, password.as_bytes())
         .expect("encryption should not fail");
 
@@ -34,23 +65,76 @@ pub fn encrypt_password(password: &str) -> String {
     base64::Engine::encode(&base64::engine::general_purpose::STANDARD, &combined)
 }
 
-/// Decrypt a stored password. Returns empty string on failure.
-pub fn decrypt_password(encrypted: &str) -> Result<String, String> {
-    let combined = base64::Engine::decode(&base64::engine::general_purpose::STANDARD, encrypted)
-        .map_err(|e| format!("base64 decode error: {e}"))?;
+/// Split a stored password into its nonce and ciphertext.
+fn decode(encrypted: &str) -> Result<(Vec<u8>, Vec<u8>), String> {
+    let mut combined =
+        base64::Engine::decode(&base64::engine::general_purpose::STANDARD, encrypted)
+            .map_err(|e| format!("base64 decode error: {e}"))?;
 
     if combined.len() < 12 {
         return Err("encrypted data too short".to_string());
     }
 
-    let key = derive_key();
-    let cipher = Aes256Gcm::new_from_slice(&key).map_err(|e| format!("cipher init error: {e}"))?;
-    let nonce = Nonce::from_slice(&combined[..12]);
-    let plaintext = cipher.decrypt(nonce, &combined[12..]).map_err(|_| {
-        "Cannot decrypt password. This may happen if the password was \
+    let ciphertext = combined.split_off(12);
+    Ok((combined, ciphertext))
+}
+
+/// Decrypt a stored password. Returns empty string on failure.
+pub fn decrypt_password(encrypted: &str) -> Result<String, String> {
+    let (nonce, ciphertext) = decode(encrypted)?;
+    let nonce = Nonce::from_slice(&nonce);
+    let plaintext = cipher()
+        .decrypt(nonce, ciphertext.as_slice())
+        .or_else(|_| legacy_cipher().decrypt(nonce, ciphertext.as_slice()))
+        .map_err(|_| {
+            "Cannot decrypt password. This may happen if the password was \
              encrypted on a different machine. Please re-enter your password."
-            .to_string()
-    })?;
+                .to_string()
+        })?;
 
     String::from_utf8(plaintext).map_err(|e| format!("utf8 decode error: {e}"))
 }
+
+/// Re-encrypt a password saved with the legacy key under the current one.
+/// Returns `None` when the password already uses the current key or cannot
+/// be read with either.
+pub fn upgrade_password(encrypted: &str) -> Option<String> {
+    let (nonce, ciphertext) = decode(encrypted).ok()?;
+    let nonce = Nonce::from_slice(&nonce);
+    if cipher().decrypt(nonce, ciphertext.as_slice()).is_ok() {
+        return None;
+    }
+    let plaintext = legacy_cipher().decrypt(nonce, ciphertext.as_slice()).ok()?;
+    let password = String::from_utf8(plaintext).ok()?;
+    Some(encrypt_password(&password))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn encrypt_legacy(password: &str) -> String {
+        let nonce = Aes256Gcm::generate_nonce(&mut OsRng);
+        let ciphertext = legacy_cipher()
+            .encrypt(&nonce, password.as_bytes())
+            .unwrap();
+        let mut combined = nonce.to_vec();
+        combined.extend_from_slice(&ciphertext);
+        base64::Engine::encode(&base64::engine::general_purpose::STANDARD, &combined)
+    }
+
+    #[test]
+    fn test_upgrade_password_reencrypts_legacy() {
+        let legacy = encrypt_legacy("secret");
+        let upgraded = upgrade_password(&legacy).unwrap();
+        assert_ne!(upgraded, legacy);
+        assert_eq!(decrypt_password(&upgraded).unwrap(), "secret");
+        assert!(upgrade_password(&upgraded).is_none());
+    }
+
+    #[test]
+    fn test_upgrade_password_leaves_current_and_invalid() {
+        assert!(upgrade_password(&encrypt_password("secret")).is_none());
+        assert!(upgrade_password("not base64!").is_none());
+    }
+}
@@ -2,14 +2,18 @@ pub mod crypto;
 pub mod models;
 pub mod presets;
 
+use std::collections::HashMap;
 use std::fs;
 use std::path::{Path, PathBuf};
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::{LazyLock, Mutex, PoisonError};
 
+use serde::Serialize;
 use serde_json::Value;
 
-use self::crypto::{decrypt_password, encrypt_password};
+use self::crypto::{decrypt_password, encrypt_password, upgrade_password};
 use self::models::{EQPreset, ServerConfig};
-use self::presets::{default_eq_presets, default_preset_names};
+use self::presets::{default_eq_presets, is_default_preset};
 
 fn default_config_dir() -> PathBuf {
     dirs::config_dir()
@@ -17,6 +21,61 @@ fn default_config_dir() -> PathBuf {
         .join("cli-music-player")
 }
 
+/// Order in which snapshots were taken, across every config.
+static SNAPSHOT_SEQ: AtomicU64 = AtomicU64::new(0);
+
+/// Newest snapshot written to each config file. Held while writing, so
+/// only one write per process is ever in progress.
+static WRITTEN: LazyLock<Mutex<HashMap<PathBuf, u64>>> =
+    LazyLock::new(|| Mutex::new(HashMap::new()));
+
+/// The config as it will be written to disk, taken on one thread and
+/// written on another.
+pub struct ConfigSnapshot {
+    seq: u64,
+    config_dir: PathBuf,
+    path: PathBuf,
+    content: String,
+}
+
+impl ConfigSnapshot {
+    /// Write the snapshot, unless one taken after it has already been
+    /// written; a background save must not undo a later direct one.
+    pub fn write(&self) {
+        let mut written = WRITTEN.lock().unwrap_or_else(PoisonError::into_inner);
+        let newest = written.entry(self.path.clone()).or_insert(0);
+        if *newest > self.seq {
+            return;
+        }
+        *newest = self.seq;
+        let _ = fs::create_dir_all(&self.config_dir);
+        // Write beside the config and rename over it, so a crash mid-write
+        // can't leave a truncated config behind. The lock above keeps this
+        // process to one writer; the pid keeps other instances off its file
+        let tmp = self
+            .path
+            .with_extension(format!("json.{}.tmp", std::process::id()));
+        if fs::write(&tmp, &self.content).is_ok() {
+            let _ = fs::rename(&tmp, &self.path);
+        }
+    }
+}
+
+/// Layout of config.json, borrowed from the live config so saving
+/// serializes straight to text without building a `Value` tree first.
+#[derive(Serialize)]
+struct ConfigFile<'a> {
+    servers: &'a [ServerConfig],
+    active_server_index: i32,
+    active_eq_preset: &'a str,
+    custom_eq_gains: &'a [f64],
+    custom_eq_presets: Vec<&'a EQPreset>,
+    volume: u32,
+    shuffle: bool,
+    repeat_mode: &'a str,
+    audio_device: &'a str,
+}
+
 pub struct AppConfig {
     config_dir: PathBuf,
     pub servers: Vec<ServerConfig>,
@@ -28,6 +87,7 @@ pub struct AppConfig {
     pub shuffle: bool,
     pub repeat_mode: String,
     pub audio_device: String,
+    server_index: HashMap<String, usize>,
 }
 
 impl AppConfig {
@@ -48,6 +108,7 @@ impl AppConfig {
             shuffle: false,
             repeat_mode: "off".to_string(),
             audio_device: "auto".to_string(),
+            server_index: HashMap::new(),
         };
         config.load_file();
         config
@@ -74,6 +135,16 @@ impl AppConfig {
                 .iter()
                 .filter_map(ServerConfig::from_value)
                 .collect();
+            self.rebuild_server_index();
+        }
+        // Passwords saved with the legacy key are re-encrypted once so later
+        // reads skip the slow key derivation
+        let mut migrated = false;
+        for server in &mut self.servers {
+            if let Some(upgraded) = upgrade_password(&server.encrypted_password) {
+                server.encrypted_password = upgraded;
+                migrated = true;
+            }
         }
         if let Some(idx) = data["active_server_index"].as_i64() {
             self.active_server_index = idx as i32;
@@ -98,42 +169,49 @@ impl AppConfig {
         }
 
         // Merge custom presets with defaults
-        let default_names = default_preset_names();
         if let Some(custom) = data["custom_eq_presets"].as_array() {
             for cp in custom {
                 if let Some(preset) = EQPreset::from_value(cp)
-                    && !default_names.contains(&preset.name)
+                    && !is_default_preset(&preset.name)
                 {
                     self.eq_presets.push(preset);
                 }
             }
         }
+
+        if migrated {
+            self.save();
+        }
     }
 
     pub fn save(&self) {
-        let _ = fs::create_dir_all(&self.config_dir);
-        let default_names = default_preset_names();
-        let custom_presets: Vec<Value> = self
-            .eq_presets
-            .iter()
-            .filter(|p| !default_names.contains(&p.name))
-            .map(|p| p.to_value())
-            .collect();
-
-        let data = serde_json::json!({
-            "servers": self.servers.iter().map(|s| s.to_value()).collect::<Vec<_>>(),
-            "active_server_index": self.active_server_index,
-            "active_eq_preset": self.active_eq_preset,
-            "custom_eq_gains": self.custom_eq_gains,
-            "custom_eq_presets": custom_presets,
-            "volume": self.volume,
-            "shuffle": self.shuffle,
-            "repeat_mode": self.repeat_mode,
-            "audio_device": self.audio_device,
-        });
-
-        let content = serde_json::to_string_pretty(&data).unwrap_or_default();
-        let _ = fs::write(self.config_file(), content);
+        self.snapshot().write();
+    }
+
+    /// Serialize the config as it stands, to be written later.
+    pub fn snapshot(&self) -> ConfigSnapshot {
+        let file = ConfigFile {
+            servers: &self.servers,
+            active_server_index: self.active_server_index,
+            active_eq_preset: &self.active_eq_preset,
+            custom_eq_gains: &self.custom_eq_gains,
+            custom_eq_presets: self
+                .eq_presets
+                .iter()
+                .filter(|p| !is_default_preset(&p.name))
+                .collect(),
+            volume: self.volume,
+            shuffle: self.shuffle,
+            repeat_mode: &self.repeat_mode,
+            audio_device: &self.audio_device,
+        };
+
+        ConfigSnapshot {
+            seq: SNAPSHOT_SEQ.fetch_add(1, Ordering::Relaxed) + 1,
+            config_dir: self.config_dir.clone(),
+            path: self.config_file(),
+            content: serde_json::to_string_pretty(&file).unwrap_or_default(),
+        }
     }
 
     pub fn active_server(&self) -> Option<&ServerConfig> {
@@ -159,6 +237,9 @@ impl AppConfig {
             encrypted_password: encrypt_password(password),
         };
         self.servers.push(server);
+        self.server_index
+            .entry(name.to_lowercase())
+            .or_insert(self.servers.len() - 1);
         if self.active_server_index < 0 {
             self.active_server_index = 0;
         }
@@ -169,6 +250,7 @@ impl AppConfig {
     pub fn remove_server(&mut self, index: usize) {
         if index < self.servers.len() {
             self.servers.remove(index);
+            self.rebuild_server_index();
             if self.active_server_index >= self.servers.len() as i32 {
                 self.active_server_index = self.servers.len() as i32 - 1;
             }
@@ -176,8 +258,27 @@ impl AppConfig {
         }
     }
 
+    /// Look up a server by name, ignoring case. The first server wins when
+    /// several names only differ by case.
+    pub fn find_server(&self, name: &str) -> Option<usize> {
+        // Keys are stored folded, so an already-lowercase query needs no copy
+        if let Some(&idx) = self.server_index.get(name) {
+            return Some(idx);
+        }
+        self.server_index.get(&name.to_lowercase()).copied()
+    }
+
+    fn rebuild_server_index(&mut self) {
+        self.server_index.clear();
+        for (i, server) in self.servers.iter().enumerate() {
+            self.server_index
+                .entry(server.name.to_lowercase())
+                .or_insert(i);
+        }
+    }
+
     pub fn set_active_server(&mut self, index: usize) {
-        if index < self.servers.len() {
+        if index < self.servers.len() && self.active_server_index != index as i32 {
             self.active_server_index = index as i32;
             self.save();
         }
@@ -205,17 +306,20 @@ impl AppConfig {
     }
 
     pub fn save_custom_eq_preset(&mut self, name: &str, gains: &[f64]) {
-        let default_names = default_preset_names();
-        let actual_name = if default_names.contains(name) {
+        let actual_name = if is_default_preset(name) {
             format!("{name} (Custom)")
         } else {
             name.to_string()
         };
-        self.eq_presets.retain(|p| p.name != actual_name);
-        self.eq_presets.push(EQPreset {
-            name: actual_name,
-            gains: gains.to_vec(),
-        });
+        if let Some(existing) = self.eq_presets.iter_mut().find(|p| p.name == actual_name) {
+            existing.gains.clear();
+            existing.gains.extend_from_slice(gains);
+        } else {
+            self.eq_presets.push(EQPreset {
+                name: actual_name,
+                gains: gains.to_vec(),
+            });
+        }
         self.save();
     }
 }
@@ -1,23 +1,16 @@
+use serde::Serialize;
 use serde_json::Value;
 
-#[derive(Debug, Clone)]
+#[derive(Debug, Clone, Serialize)]
 pub struct ServerConfig {
     pub name: String,
     pub url: String,
     pub username: String,
+    #[serde(rename = "_encrypted_password")]
     pub encrypted_password: String,
 }
 
 impl ServerConfig {
-    pub fn to_value(&self) -> Value {
-        serde_json::json!({
-            "name": self.name,
-            "url": self.url,
-            "username": self.username,
-            "_encrypted_password": self.encrypted_password,
-        })
-    }
-
     pub fn from_value(data: &Value) -> Option<Self> {
         Some(Self {
             name: data["name"].as_str()?.to_string(),
@@ -31,20 +24,13 @@ impl ServerConfig {
     }
 }
 
-#[derive(Debug, Clone)]
+#[derive(Debug, Clone, Serialize)]
 pub struct EQPreset {
     pub name: String,
     pub gains: Vec<f64>,
 }
 
 impl EQPreset {
-    pub fn to_value(&self) -> Value {
-        serde_json::json!({
-            "name": self.name,
-            "gains": self.gains,
-        })
-    }
-
     pub fn from_value(data: &Value) -> Option<Self> {
         Some(Self {
             name: data["name"].as_str()?.to_string(),
@@ -72,9 +72,20 @@ pub fn default_eq_presets() -> Vec<EQPreset> {
     ]
 }
 
-pub fn default_preset_names() -> std::collections::HashSet<String> {
-    default_eq_presets()
-        .iter()
-        .map(|p| p.name.clone())
-        .collect()
+/// Names of the built-in presets, in `default_eq_presets` order.
+pub const DEFAULT_PRESET_NAMES: [&str; 10] = [
+    "Flat",
+    "Bass Boost",
+    "Treble Boost",
+    "Vocal",
+    "Rock",
+    "Pop",
+    "Jazz",
+    "Classical",
+    "Electronic",
+    "Loudness",
+];
+
+pub fn is_default_preset(name: &str) -> bool {
+    DEFAULT_PRESET_NAMES.contains(&name)
 }
@@ -1,25 +1,20 @@
+pub use crate::audio::equalizer_dsp::{EQ_BANDS, GAIN_MAX, GAIN_MIN};
 use crate::config::AppConfig;
 use crate::config::models::EQPreset;
 use crate::player::Player;
 
-/// 18-band EQ frequencies in Hz.
-pub const EQ_BANDS: [u32; 18] = [
-    65, 92, 131, 185, 262, 370, 523, 740, 1047, 1480, 2093, 2960, 4186, 5920, 8372, 11840, 16744,
-    20000,
-];
-
 pub const EQ_BAND_LABELS: [&str; 18] = [
     "65", "92", "131", "185", "262", "370", "523", "740", "1K", "1.5K", "2.1K", "3K", "4.2K",
     "5.9K", "8.4K", "12K", "17K", "20K",
 ];
 
-pub const GAIN_MIN: f64 = -12.0;
-pub const GAIN_MAX: f64 = 12.0;
-
 pub struct Equalizer {
     pub gains: Vec<f64>,
     pub enabled: bool,
     current_preset: String,
+    /// What the player was last sent, so unchanged settings aren't resent.
+    sent_gains: Vec<f64>,
+    sent_enabled: Option<bool>,
 }
 
 impl Equalizer {
@@ -34,12 +29,23 @@ impl Equalizer {
             gains,
             enabled: true,
             current_preset: config.active_eq_preset.clone(),
+            sent_gains: Vec::new(),
+            sent_enabled: None,
         }
     }
 
-    pub fn apply(&self, player: &mut Player) {
-        player.set_eq_gains(&self.gains);
-        player.set_eq_enabled(self.enabled);
+    /// Send the gains and enabled state to the player, skipping whichever
+    /// it already has. The pipeline keeps them across tracks. Gains changed
+    /// while the EQ is off are sent when it is turned back on.
+    pub fn apply(&mut self, player: &mut Player) {
+        if self.enabled && self.sent_gains != self.gains {
+            player.set_eq_gains(&self.gains);
+            self.sent_gains.clone_from(&self.gains);
+        }
+        if self.sent_enabled != Some(self.enabled) {
+            player.set_eq_enabled(self.enabled);
+            self.sent_enabled = Some(self.enabled);
+        }
     }
 
     pub fn set_band(&mut self, index: usize, gain_db: f64, player: &mut Player) {
@@ -50,14 +56,15 @@ impl Equalizer {
     }
 
     pub fn set_all_bands(&mut self, gains: &[f64], player: &mut Player) {
-        for (i, &g) in gains.iter().take(18).enumerate() {
-            self.gains[i] = g.clamp(GAIN_MIN, GAIN_MAX);
+        for (gain, &g) in self.gains.iter_mut().zip(gains) {
+            *gain = g.clamp(GAIN_MIN, GAIN_MAX);
         }
         self.apply(player);
     }
 
     pub fn reset(&mut self, player: &mut Player) {
-        self.gains = vec![0.0; 18];
+        self.gains.clear();
+        self.gains.resize(EQ_BANDS.len(), 0.0);
         self.apply(player);
     }
 
@@ -66,12 +73,14 @@ impl Equalizer {
         self.apply(player);
     }
 
+    /// Switch to a preset and record it as the active one in `config`.
+    /// Saving the config is left to the caller, so cycling through presets
+    /// doesn't write the file on every step.
     pub fn load_preset(&mut self, preset_name: &str, config: &mut AppConfig, player: &mut Player) {
         if let Some(preset) = config.get_eq_preset(preset_name) {
-            self.gains = preset.gains.clone();
+            self.gains.clone_from(&preset.gains);
             self.current_preset = preset_name.to_string();
             config.active_eq_preset = preset_name.to_string();
-            config.save();
             self.apply(player);
         }
     }
@@ -80,8 +89,8 @@ impl Equalizer {
         config.save_custom_eq_preset(name, &self.gains);
     }
 
-    pub fn get_presets(&self, config: &AppConfig) -> Vec<EQPreset> {
-        config.eq_presets.clone()
+    pub fn get_presets<'a>(&self, config: &'a AppConfig) -> &'a [EQPreset] {
+        &config.eq_presets
     }
 
     pub fn current_preset_name(&self) -> &str {
@@ -1,4 +1,6 @@
 pub mod audio;
+pub mod cache;
+pub mod cli;
 pub mod config;
 pub mod equalizer;
 pub mod player;
@@ -6,3 +8,9 @@ pub mod queue;
 pub mod subsonic;
 pub mod tui;
 pub mod utils;
+
+pub use config::AppConfig;
+pub use tui::app::App;
+
+/// Crate version, available without touching any of the modules above.
+pub const VERSION: &str = env!("CARGO_PKG_VERSION");
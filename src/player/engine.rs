@@ -29,11 +29,24 @@ impl Player {
         self.position = 0.0;
         self.duration = 0.0;
         self.state = PlaybackState::Playing; // Set immediately for responsive UI
+        // Volume and mute carry over: the pipeline applies its current ones
+        // to each new output
         self.pipeline.send(AudioCommand::Play {
             url: url.to_string(),
         });
-        self.pipeline.send(AudioCommand::SetVolume(self.volume));
-        self.pipeline.send(AudioCommand::SetMuted(self.muted));
+    }
+
+    /// Open the stream for `url` ahead of time so a later `play` of the
+    /// same URL starts without waiting for the connection.
+    pub fn preload(&self, url: &str) {
+        self.pipeline.send(AudioCommand::Preload {
+            url: url.to_string(),
+        });
+    }
+
+    /// Drop a stream opened by `preload` that will no longer be played.
+    pub fn cancel_preload(&self) {
+        self.pipeline.send(AudioCommand::CancelPreload);
     }
 
     pub fn pause(&mut self) {
@@ -1,3 +1,5 @@
+use std::collections::HashMap;
+
 use rand::Rng;
 use rand::seq::SliceRandom;
 use serde::{Deserialize, Serialize};
@@ -60,6 +62,9 @@ pub struct QueueManager {
     shuffle: bool,
     repeat: RepeatMode,
     history: Vec<i32>,
+    total_duration: u64,
+    // How many times each song id is queued
+    queued: HashMap<String, usize>,
 }
 
 impl QueueManager {
@@ -71,6 +76,8 @@ impl QueueManager {
             shuffle: false,
             repeat: RepeatMode::Off,
             history: Vec::new(),
+            total_duration: 0,
+            queued: HashMap::new(),
         }
     }
 
@@ -90,6 +97,11 @@ impl QueueManager {
         }
     }
 
+    /// Whether a song with this id is anywhere in the queue.
+    pub fn contains(&self, song_id: &str) -> bool {
+        self.queued.contains_key(song_id)
+    }
+
     pub fn is_empty(&self) -> bool {
         self.queue.is_empty()
     }
@@ -121,7 +133,13 @@ impl QueueManager {
     }
 
     pub fn set_queue(&mut self, songs: Vec<Song>, start_index: usize) {
-        self.original_queue = songs.clone();
+        self.total_duration = songs.iter().map(|s| s.duration).sum();
+        self.queued.clear();
+        for song in &songs {
+            *self.queued.entry(song.id.clone()).or_default() += 1;
+        }
+        // Overwrite the previous copy in place, reusing its buffers
+        self.original_queue.clone_from(&songs);
         self.queue = songs;
         self.current_index = start_index as i32;
         self.history.clear();
@@ -131,17 +149,25 @@ impl QueueManager {
     }
 
     pub fn add(&mut self, song: Song) {
+        self.total_duration += song.duration;
+        *self.queued.entry(song.id.clone()).or_default() += 1;
         self.original_queue.push(song.clone());
         self.queue.push(song);
     }
 
     pub fn add_songs(&mut self, songs: Vec<Song>) {
+        self.total_duration += songs.iter().map(|s| s.duration).sum::<u64>();
+        for song in &songs {
+            *self.queued.entry(song.id.clone()).or_default() += 1;
+        }
         self.original_queue.extend(songs.clone());
         self.queue.extend(songs);
     }
 
     pub fn add_next(&mut self, song: Song) {
         let insert_pos = (self.current_index + 1) as usize;
+        self.total_duration += song.duration;
+        *self.queued.entry(song.id.clone()).or_default() += 1;
         self.original_queue.insert(insert_pos, song.clone());
         self.queue.insert(insert_pos, song);
     }
@@ -150,9 +176,16 @@ impl QueueManager {
         if index >= self.queue.len() {
             return;
         }
-        // Find the song by ID before removing, so we can remove it from original_queue too
-        let song_id = self.queue[index].id.clone();
-        self.queue.remove(index);
+        // Remove the same song (by ID) from original_queue too
+        let song = self.queue.remove(index);
+        let song_id = song.id;
+        self.total_duration -= song.duration;
+        if let Some(count) = self.queued.get_mut(&song_id) {
+            *count -= 1;
+            if *count == 0 {
+                self.queued.remove(&song_id);
+            }
+        }
         if let Some(orig_pos) = self.original_queue.iter().position(|s| s.id == song_id) {
             self.original_queue.remove(orig_pos);
         }
@@ -179,6 +212,8 @@ impl QueueManager {
     }
 
     pub fn clear(&mut self) {
+        self.total_duration = 0;
+        self.queued.clear();
         self.queue.clear();
         self.original_queue.clear();
         self.current_index = -1;
@@ -243,6 +278,27 @@ impl QueueManager {
         self.current_song()
     }
 
+    /// The song `next()` would move to, without moving. Always `None`
+    /// with shuffle on, where the next pick is random.
+    pub fn peek_next(&self) -> Option<&Song> {
+        if self.is_empty() {
+            return None;
+        }
+        if self.repeat == RepeatMode::One {
+            return self.current_song();
+        }
+        if self.shuffle {
+            return None;
+        }
+        if (self.current_index as usize) < self.queue.len() - 1 {
+            self.queue.get((self.current_index + 1) as usize)
+        } else if self.repeat == RepeatMode::All {
+            self.queue.first()
+        } else {
+            None
+        }
+    }
+
     pub fn previous(&mut self) -> Option<&Song> {
         if self.is_empty() {
             return None;
@@ -322,7 +378,7 @@ impl QueueManager {
 
     fn restore_order(&mut self) {
         let current = self.current_song().cloned();
-        self.queue = self.original_queue.clone();
+        self.queue.clone_from(&self.original_queue);
         if let Some(cur) = current {
             self.current_index = self
                 .queue
@@ -347,7 +403,7 @@ impl QueueManager {
     }
 
     pub fn total_duration(&self) -> u64 {
-        self.queue.iter().map(|s| s.duration).sum()
+        self.total_duration
     }
 
     pub fn history(&self) -> &[i32] {
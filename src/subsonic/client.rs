@@ -19,6 +19,7 @@ impl SubsonicClient {
     pub fn new(base_url: &str, username: &str, password: &str) -> Self {
         let client = Client::builder()
             .timeout(Duration::from_secs(15))
+            .connect_timeout(Duration::from_secs(3))
             .build()
             .expect("failed to build HTTP client");
         Self {
@@ -51,26 +52,32 @@ impl SubsonicClient {
         extra_params: &[(&str, &str)],
     ) -> Result<Value, SubsonicError> {
         let url = format!("{}/rest/{}", self.base_url, endpoint);
-        let mut params = self.get_auth_params();
-        for (k, v) in extra_params {
-            params.insert(k.to_string(), v.to_string());
-        }
 
-        let resp = self
-            .client
-            .get(&url)
-            .query(&params)
-            .send()
-            .await
-            .map_err(|e| {
-                if e.is_timeout() {
-                    SubsonicError::Connection(format!("Request timed out: {e}"))
-                } else if e.is_connect() {
-                    SubsonicError::Connection(format!("Cannot connect to {}: {e}", self.base_url))
-                } else {
-                    SubsonicError::Request(e)
-                }
-            })?;
+        let mut retried = false;
+        let result = loop {
+            // Extra params go on separately so a key such as "id" can repeat
+            let result = self
+                .client
+                .get(&url)
+                .query(&self.get_auth_params())
+                .query(extra_params)
+                .send()
+                .await;
+            match &result {
+                // Nothing reached the server, so one more attempt is safe
+                Err(e) if e.is_connect() && !retried => retried = true,
+                _ => break result,
+            }
+        };
+        let resp = result.map_err(|e| {
+            if e.is_timeout() {
+                SubsonicError::Connection(format!("Request timed out: {e}"))
+            } else if e.is_connect() {
+                SubsonicError::Connection(format!("Cannot connect to {}: {e}", self.base_url))
+            } else {
+                SubsonicError::Request(e)
+            }
+        })?;
 
         let data: Value = resp.json().await?;
         let sub_response = &data["subsonic-response"];
@@ -321,6 +328,15 @@ impl SubsonicClient {
         Ok((artists, albums, songs))
     }
 
+    /// Starred songs only, skipping the starred artists and albums.
+    pub async fn get_starred_songs(&self) -> Result<Vec<Song>, SubsonicError> {
+        let resp = self.request("getStarred2.view", &[]).await?;
+        Ok(resp["starred2"]["song"]
+            .as_array()
+            .map(|a| a.iter().map(Song::from_api).collect())
+            .unwrap_or_default())
+    }
+
     pub async fn star(&self, id: &str) -> Result<(), SubsonicError> {
         self.request("star.view", &[("id", id)]).await?;
         Ok(())
@@ -331,6 +347,20 @@ impl SubsonicClient {
         Ok(())
     }
 
+    /// Star several items with a single request.
+    pub async fn star_many(&self, ids: &[String]) -> Result<(), SubsonicError> {
+        let params: Vec<(&str, &str)> = ids.iter().map(|id| ("id", id.as_str())).collect();
+        self.request("star.view", &params).await?;
+        Ok(())
+    }
+
+    /// Unstar several items with a single request.
+    pub async fn unstar_many(&self, ids: &[String]) -> Result<(), SubsonicError> {
+        let params: Vec<(&str, &str)> = ids.iter().map(|id| ("id", id.as_str())).collect();
+        self.request("unstar.view", &params).await?;
+        Ok(())
+    }
+
     // ── Scrobbling ──────────────────────────────────────────────────
 
     pub async fn scrobble(&self, song_id: &str, submission: bool) -> Result<(), SubsonicError> {
@@ -340,6 +370,14 @@ impl SubsonicClient {
         Ok(())
     }
 
+    /// Submit several plays with a single request.
+    pub async fn scrobble_many(&self, song_ids: &[String]) -> Result<(), SubsonicError> {
+        let mut params: Vec<(&str, &str)> = song_ids.iter().map(|id| ("id", id.as_str())).collect();
+        params.push(("submission", "true"));
+        self.request("scrobble.view", &params).await?;
+        Ok(())
+    }
+
     pub async fn now_playing(&self, song_id: &str) -> Result<(), SubsonicError> {
         self.scrobble(song_id, false).await
     }
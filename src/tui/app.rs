@@ -1,5 +1,7 @@
-use std::collections::HashSet;
+use std::collections::{HashMap, HashSet, VecDeque};
 use std::io;
+use std::sync::{Arc, mpsc};
+use std::thread;
 use std::time::{Duration, Instant};
 
 use anyhow::Result;
@@ -18,8 +20,9 @@ use ratatui::style::Style;
 use ratatui::text::Span;
 use ratatui::widgets::Paragraph;
 
-use crate::audio::pipeline::AudioEvent;
-use crate::config::AppConfig;
+use crate::audio::pipeline::{AudioEvent, preload_due};
+use crate::cache::{BoundedCache, TtlCache};
+use crate::config::{AppConfig, ConfigSnapshot};
 use crate::equalizer::Equalizer;
 use crate::player::Player;
 use crate::queue::{QueueManager, RepeatMode};
@@ -29,6 +32,36 @@ use crate::tui::theme;
 use crate::tui::widgets::{
     browser, equalizer, help, lyrics, now_playing, queue_view, search, server_mgr,
 };
+use crate::utils;
+
+const STATUS_TEXT: &str = concat!(
+    " cli-music-player v",
+    env!("CARGO_PKG_VERSION"),
+    " │ ? for help"
+);
+const CONFIG_SAVE_DELAY: Duration = Duration::from_secs(1);
+const STAR_FLUSH_DELAY: Duration = Duration::from_millis(300);
+/// How long a loaded browser list is reused before switching to its tab
+/// fetches it again.
+const TAB_DATA_TTL: Duration = Duration::from_secs(30);
+/// Album lists for every sort order are fetched at startup and kept longer,
+/// so cycling the sort order doesn't wait on the server.
+const ALBUM_LIST_TTL: Duration = Duration::from_secs(60);
+const MAX_PLAY_HISTORY: usize = 100;
+const MAX_NAV_HISTORY: usize = 50;
+const LYRICS_CACHE_SIZE: usize = 256;
+/// Recently opened albums, artists, playlists and genres are shown again
+/// without a request for this long.
+const BROWSE_CACHE_SIZE: usize = 32;
+const BROWSE_CACHE_TTL: Duration = Duration::from_secs(60);
+/// Albums fetched per request; scrolling within `ALBUM_PAGE_MARGIN` rows of
+/// the end of the list fetches the next page.
+const ALBUM_PAGE_SIZE: u32 = 50;
+const ALBUM_PAGE_MARGIN: usize = 10;
+/// Radio starts playing from a short list of similar songs, then tops the
+/// queue up to the full size.
+const RADIO_FIRST_BATCH: u32 = 10;
+const RADIO_SIZE: u32 = 50;
 
 const ALBUM_SORT_TYPES: &[&str] = &[
     "newest",
@@ -38,6 +71,9 @@ const ALBUM_SORT_TYPES: &[&str] = &[
     "frequent",
     "random",
 ];
+/// Sort order that gives a fresh list on every request, so it is never
+/// cached or fetched ahead.
+const ALBUM_SORT_RANDOM: &str = "random";
 
 #[derive(Clone, Copy, PartialEq, Eq)]
 enum ModalKind {
@@ -52,13 +88,130 @@ enum Focus {
     Queue,
 }
 
+/// Scrobble progress of the current track, checked on every position
+/// update. The threshold is fixed when the track starts.
+struct ScrobbleState {
+    reported: bool,
+    at: f64,
+}
+
+impl ScrobbleState {
+    fn new(duration_secs: u64) -> Self {
+        Self {
+            reported: false,
+            at: utils::scrobble_threshold(duration_secs as f64),
+        }
+    }
+}
+
+/// A drill-down from one of the browser tabs or from search.
+#[derive(Clone, PartialEq, Eq, Hash)]
+enum BrowseRequest {
+    Album(String),
+    Artist(String),
+    Playlist(String),
+    Genre(String),
+}
+
+#[derive(Clone)]
+enum BrowseView {
+    Songs(Vec<Song>),
+    Albums(Vec<Album>),
+}
+
+/// Playback reports for the server, sent in order by one background task.
+enum Report {
+    NowPlaying(String),
+    Scrobble(String),
+}
+
+/// Every browser list, as fetched right after connecting; `None` where a
+/// request failed.
+struct Library {
+    albums: Option<Vec<Album>>,
+    artists: Option<Vec<Artist>>,
+    songs: Option<Vec<Song>>,
+    playlists: Option<Vec<Playlist>>,
+    genres: Option<Vec<Genre>>,
+    starred: Option<Vec<Song>>,
+}
+
+/// The list behind one of the browser tabs, refetched on switching to it.
+enum TabList {
+    Artists(Vec<Artist>),
+    Songs(Vec<Song>),
+    Playlists(Vec<Playlist>),
+    Genres(Vec<Genre>),
+    Starred(Vec<Song>),
+}
+
+/// Results of requests run on the tokio runtime, handed back to the UI
+/// thread so the event loop never waits on the network.
+enum FetchResult {
+    /// A full library load; dropped if another one has started since, and
+    /// kept off the album and song lists if a drill-down has replaced them.
+    Library {
+        seq: u64,
+        browse_seq: u64,
+        sort_index: usize,
+        library: Library,
+    },
+    Browse {
+        seq: u64,
+        origin: (usize, Option<usize>),
+        request: BrowseRequest,
+        view: BrowseView,
+    },
+    /// A tab's list, tagged with the library load and drill-down it was
+    /// requested under.
+    Tab {
+        library_seq: u64,
+        browse_seq: u64,
+        list: TabList,
+    },
+    Search {
+        query: String,
+        artists: Vec<Artist>,
+        albums: Vec<Album>,
+        songs: Vec<Song>,
+    },
+    Lyrics {
+        key: (String, String),
+        lyrics: String,
+    },
+    Albums {
+        sort_index: usize,
+        albums: Vec<Album>,
+    },
+    /// A further page of an album list; `None` if the request failed.
+    AlbumPage {
+        sort_index: usize,
+        offset: usize,
+        albums: Option<Vec<Album>>,
+    },
+    Radio(Vec<Song>),
+    /// The rest of a radio queue whose first song is `head`.
+    RadioMore {
+        head: String,
+        songs: Vec<Song>,
+    },
+    /// A star or unstar batch failed; `starred` is the state to restore.
+    StarFailed {
+        ids: Vec<String>,
+        starred: bool,
+    },
+}
+
 pub struct App {
     pub config: AppConfig,
     player: Player,
     queue_mgr: QueueManager,
     equalizer_state: Equalizer,
-    client: Option<SubsonicClient>,
+    client: Option<Arc<SubsonicClient>>,
     rt: tokio::runtime::Runtime,
+    fetch_tx: mpsc::Sender<FetchResult>,
+    fetch_rx: mpsc::Receiver<FetchResult>,
+    report_tx: Option<tokio::sync::mpsc::UnboundedSender<Report>>,
 
     // UI state
     should_quit: bool,
@@ -72,24 +225,38 @@ pub struct App {
     tab_selected: [Option<usize>; 7],
     queue_selected: Option<usize>,
 
-    // Navigation
-    nav_history: Vec<(usize, Option<usize>)>,
+    // Navigation; only the latest drill-down request is applied
+    nav_history: VecDeque<(usize, Option<usize>)>,
+    browse_seq: u64,
     album_sort_index: usize,
 
-    // Cached data
+    // Cached data; album lists are also kept per sort order, and the other
+    // tabs remember when their list was fetched
     albums: Vec<Album>,
+    album_lists: TtlCache<usize, Vec<Album>>,
+    browse_cache: TtlCache<BrowseRequest, BrowseView>,
+    album_pages_left: bool,
+    album_page_pending: bool,
+    tab_loaded_at: [Option<Instant>; 7],
+    library_seq: u64,
     artists: Vec<Artist>,
     songs: Vec<Song>,
     playlists: Vec<Playlist>,
     genres: Vec<Genre>,
     starred_songs: Vec<Song>,
-    play_history: Vec<Song>,
+    play_history: VecDeque<Song>,
 
-    // Starred IDs for quick lookup
+    // Starred IDs for quick lookup, and star changes not yet sent
     starred_ids: HashSet<String>,
+    pending_stars: HashMap<String, bool>,
+    star_flush_at: Option<Instant>,
 
     // Scrobbling
-    scrobble_reported: bool,
+    scrobble: ScrobbleState,
+
+    // Next track, prepared near the end of the current one: (song id, URL)
+    next_prefetched: bool,
+    preloaded: Option<(String, String)>,
 
     // Search state
     search_query: String,
@@ -99,9 +266,11 @@ pub struct App {
     search_tab: usize,
     search_selected: Option<usize>,
 
-    // Lyrics
+    // Lyrics, cached by (artist, title); songs without lyrics cache ""
     lyrics_text: String,
+    lyrics_song_id: Option<String>,
     lyrics_scroll: u16,
+    lyrics_cache: BoundedCache<(String, String), String>,
 
     // Server manager state
     server_selected: Option<usize>,
@@ -125,6 +294,16 @@ pub struct App {
     last_click_time: Instant,
     last_click_row: u16,
     last_click_col: u16,
+
+    // Pending config write; pushed back by every change until things settle,
+    // then handed to the writer thread so the UI never waits on the disk
+    config_save_at: Option<Instant>,
+    config_tx: Option<mpsc::Sender<ConfigSnapshot>>,
+    config_writer: Option<thread::JoinHandle<()>>,
+
+    // Redraw tracking: frames are only drawn after something visible changed
+    needs_redraw: bool,
+    shown_time: (u64, u64),
 }
 
 impl App {
@@ -147,6 +326,7 @@ impl App {
         let has_servers = !config.servers.is_empty();
 
         let rt = tokio::runtime::Runtime::new().expect("Failed to create tokio runtime");
+        let (fetch_tx, fetch_rx) = mpsc::channel();
 
         Self {
             config,
@@ -155,6 +335,9 @@ impl App {
             equalizer_state: eq_state,
             client: None,
             rt,
+            fetch_tx,
+            fetch_rx,
+            report_tx: None,
             should_quit: false,
             active_tab: 0,
             focus: Focus::Browser,
@@ -163,17 +346,28 @@ impl App {
             lyrics_visible: false,
             tab_selected: [Some(0); 7],
             queue_selected: None,
-            nav_history: Vec::new(),
+            nav_history: VecDeque::with_capacity(MAX_NAV_HISTORY + 1),
+            browse_seq: 0,
             album_sort_index: 0,
             albums: Vec::new(),
+            album_lists: TtlCache::new(ALBUM_SORT_TYPES.len(), ALBUM_LIST_TTL),
+            browse_cache: TtlCache::new(BROWSE_CACHE_SIZE, BROWSE_CACHE_TTL),
+            album_pages_left: false,
+            album_page_pending: false,
+            tab_loaded_at: [None; 7],
+            library_seq: 0,
             artists: Vec::new(),
             songs: Vec::new(),
             playlists: Vec::new(),
             genres: Vec::new(),
             starred_songs: Vec::new(),
-            play_history: Vec::new(),
+            play_history: VecDeque::with_capacity(MAX_PLAY_HISTORY + 1),
             starred_ids: HashSet::new(),
-            scrobble_reported: false,
+            pending_stars: HashMap::new(),
+            star_flush_at: None,
+            scrobble: ScrobbleState::new(0),
+            next_prefetched: false,
+            preloaded: None,
             search_query: String::new(),
             search_artists: Vec::new(),
             search_albums: Vec::new(),
@@ -181,7 +375,9 @@ impl App {
             search_tab: 0,
             search_selected: None,
             lyrics_text: String::new(),
+            lyrics_song_id: None,
             lyrics_scroll: 0,
+            lyrics_cache: BoundedCache::new(LYRICS_CACHE_SIZE),
             server_selected: if has_servers { Some(0) } else { None },
             server_form: Default::default(),
             server_active_field: 0,
@@ -195,12 +391,11 @@ impl App {
             last_click_time: Instant::now(),
             last_click_row: u16::MAX,
             last_click_col: u16::MAX,
-        }
-    }
-
-    pub fn select_server_by_name(&mut self, name: &str) {
-        if let Some(idx) = self.config.servers.iter().position(|s| s.name == name) {
-            self.config.set_active_server(idx);
+            config_save_at: None,
+            config_tx: None,
+            config_writer: None,
+            needs_redraw: true,
+            shown_time: (0, 0),
         }
     }
 
@@ -215,34 +410,69 @@ impl App {
         self.connect_to_active_server();
 
         // Initial data load
-        self.load_library_data();
+        self.load_all_library_data();
 
         let events = EventHandler::new(Duration::from_millis(100));
+        self.start_config_writer();
 
         while !self.should_quit {
-            terminal.draw(|f| self.draw(f))?;
+            if self.needs_redraw {
+                terminal.draw(|f| self.draw(f))?;
+                self.needs_redraw = false;
+            }
 
-            // Poll audio events
-            let audio_events = self.player.poll_events();
-            for event in audio_events {
+            // Poll audio events; of a run of position updates queued while
+            // the loop was busy, only the latest is handled
+            let mut audio_events = self.player.poll_events().into_iter().peekable();
+            while let Some(event) = audio_events.next() {
+                if matches!(event, AudioEvent::PositionUpdate { .. })
+                    && matches!(audio_events.peek(), Some(AudioEvent::PositionUpdate { .. }))
+                {
+                    continue;
+                }
                 self.handle_audio_event(event);
             }
 
-            match events.next()? {
-                AppEvent::Key(key) if key.kind == KeyEventKind::Press => self.handle_key(key),
-                AppEvent::Key(_) => {} // Ignore Release/Repeat events
-                AppEvent::Mouse(mouse) => self.handle_mouse(mouse),
-                AppEvent::Tick => {}
-                AppEvent::Resize(_, _) => {}
+            // Apply finished background requests
+            while let Ok(result) = self.fetch_rx.try_recv() {
+                self.handle_fetch_result(result);
+            }
+
+            if self.config_save_at.is_some_and(|at| Instant::now() >= at) {
+                self.config_save_at = None;
+                if let Some(tx) = &self.config_tx {
+                    let _ = tx.send(self.config.snapshot());
+                }
+            }
+            if self.star_flush_at.is_some_and(|at| Instant::now() >= at) {
+                self.flush_stars();
+            }
+
+            // Take everything that queued up during the last frame before
+            // drawing again, so a held key costs one frame, not one per repeat
+            self.handle_event(events.next()?);
+            while !self.should_quit
+                && let Some(event) = events.try_next()
+            {
+                self.handle_event(event);
             }
         }
 
-        // Cleanup
+        // Cleanup; let the writer finish so its snapshot can't land after
+        // the final save
+        self.config_tx = None;
+        if let Some(writer) = self.config_writer.take() {
+            let _ = writer.join();
+        }
+        for handle in self.flush_stars() {
+            let _ = self.rt.block_on(handle);
+        }
         self.player.shutdown();
-        self.config.volume = self.player.volume;
-        self.config.shuffle = self.queue_mgr.shuffle_enabled();
-        self.config.repeat_mode = self.queue_mgr.repeat_mode().as_str().to_string();
-        self.config.save();
+        // Everything already written needs no final save
+        let unsaved = self.config_save_at.is_some();
+        if self.sync_playback_settings() || unsaved {
+            self.config.save();
+        }
 
         disable_raw_mode()?;
         execute!(
@@ -255,30 +485,291 @@ impl App {
         Ok(())
     }
 
+    fn handle_event(&mut self, event: AppEvent) {
+        match event {
+            AppEvent::Key(key) if key.kind == KeyEventKind::Press => {
+                self.handle_key(key);
+                self.needs_redraw = true;
+            }
+            AppEvent::Key(_) => {} // Ignore Release/Repeat events
+            AppEvent::Mouse(mouse) => self.handle_mouse(mouse),
+            AppEvent::Tick => {}
+            AppEvent::Resize(_, _) => self.needs_redraw = true,
+        }
+    }
+
+    /// Write config snapshots in the background, skipping any that a newer
+    /// one has already replaced.
+    fn start_config_writer(&mut self) {
+        let (tx, rx) = mpsc::channel::<ConfigSnapshot>();
+        self.config_writer = Some(thread::spawn(move || {
+            while let Ok(mut snapshot) = rx.recv() {
+                while let Ok(newer) = rx.try_recv() {
+                    snapshot = newer;
+                }
+                snapshot.write();
+            }
+        }));
+        self.config_tx = Some(tx);
+    }
+
+    /// Copy volume, shuffle and repeat into the config. Returns whether any
+    /// of them changed.
+    fn sync_playback_settings(&mut self) -> bool {
+        let shuffle = self.queue_mgr.shuffle_enabled();
+        let repeat_mode = self.queue_mgr.repeat_mode().as_str();
+        if self.config.volume == self.player.volume
+            && self.config.shuffle == shuffle
+            && self.config.repeat_mode == repeat_mode
+        {
+            return false;
+        }
+        self.config.volume = self.player.volume;
+        self.config.shuffle = shuffle;
+        self.config.repeat_mode = repeat_mode.to_string();
+        true
+    }
+
+    /// Persist volume, shuffle and repeat after a change, batched with any
+    /// other changes made in quick succession.
+    fn save_playback_settings(&mut self) {
+        self.sync_playback_settings();
+        self.schedule_config_save();
+    }
+
+    /// Save the config once it has gone `CONFIG_SAVE_DELAY` without changes.
+    fn schedule_config_save(&mut self) {
+        self.config_save_at = Some(Instant::now() + CONFIG_SAVE_DELAY);
+    }
+
     fn connect_to_active_server(&mut self) {
+        // Pending stars belong to the server they were made on
+        self.flush_stars();
+        // So does a next track opened ahead of time
+        if self.preloaded.take().is_some() {
+            self.player.cancel_preload();
+        }
         if let Some(server) = self.config.active_server() {
             let password = self.config.get_password(Some(server));
             if !password.is_empty() {
-                self.client = Some(SubsonicClient::new(
+                self.client = Some(Arc::new(SubsonicClient::new(
                     &server.url,
                     &server.username,
                     &password,
-                ));
+                )));
             } else {
                 self.client = None;
             }
         } else {
             self.client = None;
         }
+        self.start_reporter();
     }
 
-    fn load_library_data(&mut self) {
-        if let Some(client) = &self.client {
-            let sort_type = ALBUM_SORT_TYPES[self.album_sort_index];
-            if let Ok(albums) = self.rt.block_on(client.get_album_list(sort_type, 50, 0)) {
-                self.albums = albums;
+    /// Start the task that sends playback reports to the current server.
+    /// Whatever queued up while a request was out goes in the next round:
+    /// scrobbles in one request, and only the latest now-playing song.
+    fn start_reporter(&mut self) {
+        // Dropping the old sender lets the previous server's task finish
+        self.report_tx = self.client.clone().map(|client| {
+            let (tx, mut rx) = tokio::sync::mpsc::unbounded_channel();
+            self.rt.spawn(async move {
+                while let Some(report) = rx.recv().await {
+                    let mut now_playing = None;
+                    let mut scrobbles = Vec::new();
+                    let mut next = Some(report);
+                    while let Some(report) = next {
+                        match report {
+                            Report::NowPlaying(id) => now_playing = Some(id),
+                            Report::Scrobble(id) => scrobbles.push(id),
+                        }
+                        next = rx.try_recv().ok();
+                    }
+                    if !scrobbles.is_empty() {
+                        let _ = client.scrobble_many(&scrobbles).await;
+                    }
+                    if let Some(id) = now_playing {
+                        let _ = client.now_playing(&id).await;
+                    }
+                }
+            });
+            tx
+        });
+    }
+
+    fn report(&self, report: Report) {
+        if let Some(tx) = &self.report_tx {
+            let _ = tx.send(report);
+        }
+    }
+
+    /// Fetch every browser list concurrently in the background, so the
+    /// load waits for the slowest request rather than the sum of them and
+    /// the UI is drawn while it runs.
+    fn load_all_library_data(&mut self) {
+        // Everything cached so far came from the previous server
+        self.library_seq += 1;
+        self.album_lists.clear();
+        self.browse_cache.clear();
+        self.tab_loaded_at = [None; 7];
+        let Some(client) = self.client.clone() else {
+            return;
+        };
+        let seq = self.library_seq;
+        let browse_seq = self.browse_seq;
+        let sort_index = self.album_sort_index;
+        let sort_type = ALBUM_SORT_TYPES[sort_index];
+        let tx = self.fetch_tx.clone();
+        self.rt.spawn(async move {
+            let (albums, artists, songs, playlists, genres, starred) = tokio::join!(
+                client.get_album_list(sort_type, ALBUM_PAGE_SIZE, 0),
+                client.get_artists(),
+                client.get_random_songs(50, ""),
+                client.get_playlists(),
+                client.get_genres(),
+                client.get_starred_songs(),
+            );
+            let _ = tx.send(FetchResult::Library {
+                seq,
+                browse_seq,
+                sort_index,
+                library: Library {
+                    albums: albums.ok(),
+                    artists: artists.ok(),
+                    songs: songs.ok(),
+                    playlists: playlists.ok(),
+                    genres: genres.ok(),
+                    starred: starred.ok(),
+                },
+            });
+        });
+    }
+
+    fn apply_library(&mut self, browse_seq: u64, sort_index: usize, library: Library) {
+        let now = Some(Instant::now());
+        // A drill-down opened while the load ran is showing its own albums
+        // or songs, which the library's lists must not replace
+        let browsed = browse_seq != self.browse_seq;
+        if let Some(albums) = library.albums {
+            if !browsed && sort_index == self.album_sort_index {
+                self.set_album_list(albums.clone());
             }
+            self.cache_album_list(sort_index, albums);
         }
+        if let Some(artists) = library.artists {
+            self.artists = artists;
+            self.tab_loaded_at[1] = now;
+        }
+        if let Some(songs) = library.songs
+            && !browsed
+        {
+            self.songs = songs;
+            self.tab_loaded_at[2] = now;
+        }
+        if let Some(playlists) = library.playlists {
+            self.playlists = playlists;
+            self.tab_loaded_at[3] = now;
+        }
+        if let Some(genres) = library.genres {
+            self.genres = genres;
+            self.tab_loaded_at[4] = now;
+        }
+        if let Some(songs) = library.starred {
+            self.set_starred_songs(songs);
+            self.tab_loaded_at[5] = now;
+        }
+        self.warm_album_sorts();
+        self.needs_redraw = true;
+    }
+
+    /// Fetch the first page of every other sort order in the background.
+    fn warm_album_sorts(&self) {
+        let Some(client) = &self.client else {
+            return;
+        };
+        for (sort_index, &sort_type) in ALBUM_SORT_TYPES.iter().enumerate() {
+            if sort_type == ALBUM_SORT_RANDOM || self.album_lists.get(&sort_index).is_some() {
+                continue;
+            }
+            let client = client.clone();
+            self.spawn_fetch(
+                async move { client.get_album_list(sort_type, ALBUM_PAGE_SIZE, 0).await },
+                move |albums| FetchResult::Albums { sort_index, albums },
+            );
+        }
+    }
+
+    fn load_library_data(&mut self) {
+        let sort_index = self.album_sort_index;
+        if let Some(albums) = self.album_lists.get(&sort_index) {
+            self.albums.clone_from(albums);
+            // Every page but the last one is full
+            self.album_pages_left =
+                !albums.is_empty() && albums.len() % ALBUM_PAGE_SIZE as usize == 0;
+            return;
+        }
+        let Some(client) = self.client.clone() else {
+            return;
+        };
+        let sort_type = ALBUM_SORT_TYPES[sort_index];
+        self.spawn_fetch(
+            async move { client.get_album_list(sort_type, ALBUM_PAGE_SIZE, 0).await },
+            move |albums| FetchResult::Albums { sort_index, albums },
+        );
+    }
+
+    /// Remember a sort order's list, unless it is shuffled anew each time.
+    fn cache_album_list(&mut self, sort_index: usize, albums: Vec<Album>) {
+        if ALBUM_SORT_TYPES[sort_index] != ALBUM_SORT_RANDOM {
+            self.album_lists.insert(sort_index, albums);
+        }
+    }
+
+    /// Show the first page of the current sort order.
+    fn set_album_list(&mut self, albums: Vec<Album>) {
+        self.album_pages_left = albums.len() == ALBUM_PAGE_SIZE as usize
+            && ALBUM_SORT_TYPES[self.album_sort_index] != ALBUM_SORT_RANDOM;
+        self.albums = albums;
+    }
+
+    /// Show an artist's albums, which come complete in one response.
+    fn set_artist_albums(&mut self, albums: Vec<Album>) {
+        self.album_pages_left = false;
+        self.albums = albums;
+        self.active_tab = 0;
+        self.tab_selected[0] = Some(0);
+    }
+
+    /// Fetch the next page of the album list once the selection comes
+    /// within `ALBUM_PAGE_MARGIN` rows of its end.
+    fn load_more_albums(&mut self) {
+        if self.active_tab != 0 || !self.album_pages_left || self.album_page_pending {
+            return;
+        }
+        let offset = self.albums.len();
+        if self.tab_selected[0].unwrap_or(0) + ALBUM_PAGE_MARGIN < offset {
+            return;
+        }
+        let Some(client) = self.client.clone() else {
+            return;
+        };
+        self.album_page_pending = true;
+        let sort_index = self.album_sort_index;
+        let sort_type = ALBUM_SORT_TYPES[sort_index];
+        let tx = self.fetch_tx.clone();
+        // Unlike `spawn_fetch`, failures are reported too so the next
+        // scroll can retry
+        self.rt.spawn(async move {
+            let albums = client
+                .get_album_list(sort_type, ALBUM_PAGE_SIZE, offset as u32)
+                .await
+                .ok();
+            let _ = tx.send(FetchResult::AlbumPage {
+                sort_index,
+                offset,
+                albums,
+            });
+        });
     }
 
     fn draw(&mut self, f: &mut ratatui::Frame) {
@@ -334,6 +825,7 @@ impl App {
             f,
             content_layout[1],
             self.queue_mgr.queue(),
+            self.queue_mgr.total_duration(),
             self.queue_mgr.current_index(),
             self.queue_selected,
         );
@@ -364,7 +856,7 @@ impl App {
 
         // Status bar
         let status = Paragraph::new(Span::styled(
-            " cli-music-player v3.0.0 │ ? for help",
+            STATUS_TEXT,
             Style::default().fg(theme::TEXT_MUTED),
         ))
         .style(Style::default().bg(theme::SURFACE_DARK));
@@ -427,23 +919,49 @@ impl App {
         match self.active_tab {
             0 => browser::render_albums_table(f, area, &self.albums, self.tab_selected[0]),
             1 => browser::render_artists_table(f, area, &self.artists, self.tab_selected[1]),
-            2 => browser::render_songs_table(f, area, &self.songs, self.tab_selected[2]),
+            2 => browser::render_songs_table(f, area, &self.songs, self.tab_selected[2], |id| {
+                self.queue_mgr.contains(id)
+            }),
             3 => browser::render_playlists_table(f, area, &self.playlists, self.tab_selected[3]),
             4 => browser::render_genres_table(f, area, &self.genres, self.tab_selected[4]),
-            5 => browser::render_songs_table(f, area, &self.starred_songs, self.tab_selected[5]),
-            6 => browser::render_songs_table(f, area, &self.play_history, self.tab_selected[6]),
+            5 => browser::render_songs_table(
+                f,
+                area,
+                &self.starred_songs,
+                self.tab_selected[5],
+                |id| self.queue_mgr.contains(id),
+            ),
+            6 => browser::render_songs_table(
+                f,
+                area,
+                self.play_history.make_contiguous(),
+                self.tab_selected[6],
+                |id| self.queue_mgr.contains(id),
+            ),
             _ => {}
         }
     }
 
     fn handle_audio_event(&mut self, event: AudioEvent) {
+        // Position updates arrive several times a second, but the display
+        // only shows whole seconds
+        if let AudioEvent::PositionUpdate { position, duration } = event {
+            let time = (position as u64, duration as u64);
+            if time != self.shown_time {
+                self.shown_time = time;
+                self.needs_redraw = true;
+            }
+        } else {
+            self.needs_redraw = true;
+        }
+
         match event {
             AudioEvent::TrackEnd => {
-                self.scrobble_reported = false;
+                self.scrobble.reported = false;
                 if let Some(song) = self.player.current_song.clone() {
-                    self.play_history.push(song);
-                    if self.play_history.len() > 100 {
-                        self.play_history.remove(0);
+                    self.play_history.push_back(song);
+                    if self.play_history.len() > MAX_PLAY_HISTORY {
+                        self.play_history.pop_front();
                     }
                 }
                 // Auto-advance
@@ -453,26 +971,17 @@ impl App {
             }
             AudioEvent::PositionUpdate { position, duration } => {
                 // Scrobble check
-                if !self.scrobble_reported && duration > 0.0 {
-                    let at_50_percent = position >= duration * 0.5;
-                    let at_240s = position >= 240.0;
-                    if at_50_percent || at_240s {
-                        self.scrobble_reported = true;
-                        if let (Some(client), Some(song)) =
-                            (&self.client, &self.player.current_song)
-                        {
-                            let song_id = song.id.clone();
-                            // Fire-and-forget: spawn async task to avoid blocking UI
-                            let url = client.base_url().to_string();
-                            let username = client.username().to_string();
-                            let password = client.password().to_string();
-                            self.rt.spawn(async move {
-                                let c = SubsonicClient::new(&url, &username, &password);
-                                let _ = c.scrobble(&song_id, true).await;
-                            });
-                        }
+                if !self.scrobble.reported && position >= self.scrobble.at {
+                    self.scrobble.reported = true;
+                    if let Some(song) = &self.player.current_song {
+                        self.report(Report::Scrobble(song.id.clone()));
                     }
                 }
+
+                if !self.next_prefetched && preload_due(position, duration) {
+                    self.next_prefetched = true;
+                    self.prefetch_next();
+                }
             }
             _ => {}
         }
@@ -537,7 +1046,7 @@ impl App {
                     // Cycle through presets
                     let presets = self.equalizer_state.get_presets(&self.config);
                     if !presets.is_empty() {
-                        let current = self.equalizer_state.current_preset_name().to_string();
+                        let current = self.equalizer_state.current_preset_name();
                         let idx = presets.iter().position(|p| p.name == current).unwrap_or(0);
                         let next_idx = if key.code == KeyCode::Char('P') {
                             // Shift+P = previous preset
@@ -551,6 +1060,7 @@ impl App {
                             &mut self.config,
                             &mut self.player,
                         );
+                        self.schedule_config_save();
                     }
                     return;
                 }
@@ -559,6 +1069,7 @@ impl App {
         }
 
         // Global key bindings
+        let shift = key.modifiers.contains(KeyModifiers::SHIFT);
         match key.code {
             KeyCode::Char('q') => self.should_quit = true,
             KeyCode::Char(' ') => {
@@ -577,32 +1088,40 @@ impl App {
             KeyCode::Char('s') => self.player.stop(),
 
             // Seek
-            KeyCode::Right if key.modifiers.contains(KeyModifiers::SHIFT) => self.player.seek(30.0),
-            KeyCode::Left if key.modifiers.contains(KeyModifiers::SHIFT) => self.player.seek(-30.0),
+            KeyCode::Right if shift => self.player.seek(30.0),
+            KeyCode::Left if shift => self.player.seek(-30.0),
             KeyCode::Right => self.player.seek(5.0),
             KeyCode::Left => self.player.seek(-5.0),
 
             // Volume
-            KeyCode::Char('+') | KeyCode::Char('=') => self.player.volume_up(5),
-            KeyCode::Char('-') | KeyCode::Char('_') => self.player.volume_down(5),
+            KeyCode::Char('+') | KeyCode::Char('=') => {
+                self.player.volume_up(5);
+                self.save_playback_settings();
+            }
+            KeyCode::Char('-') | KeyCode::Char('_') => {
+                self.player.volume_down(5);
+                self.save_playback_settings();
+            }
             KeyCode::Char('m') => self.player.mute_toggle(),
 
             // Queue
             KeyCode::Char('z') => {
                 self.queue_mgr.toggle_shuffle();
+                self.save_playback_settings();
             }
             KeyCode::Char('r') => {
                 self.queue_mgr.cycle_repeat();
+                self.save_playback_settings();
             }
             KeyCode::Char('a') => self.add_selected_to_queue(),
             KeyCode::Char('d') | KeyCode::Delete => self.remove_from_queue(),
             KeyCode::Char('c') => self.queue_mgr.clear(),
 
             // Reorder queue
-            KeyCode::Up if key.modifiers.contains(KeyModifiers::SHIFT) => {
+            KeyCode::Up if shift => {
                 self.move_queue_item_up();
             }
-            KeyCode::Down if key.modifiers.contains(KeyModifiers::SHIFT) => {
+            KeyCode::Down if shift => {
                 self.move_queue_item_down();
             }
 
@@ -614,13 +1133,7 @@ impl App {
             KeyCode::Tab => self.cycle_focus(),
 
             // Tab switching
-            KeyCode::Char('1') => self.switch_tab(0),
-            KeyCode::Char('2') => self.switch_tab(1),
-            KeyCode::Char('3') => self.switch_tab(2),
-            KeyCode::Char('4') => self.switch_tab(3),
-            KeyCode::Char('5') => self.switch_tab(4),
-            KeyCode::Char('6') => self.switch_tab(5),
-            KeyCode::Char('7') => self.switch_tab(6),
+            KeyCode::Char(c @ '1'..='7') => self.switch_tab(c as usize - '1' as usize),
 
             // Features
             KeyCode::Char('/') => {
@@ -655,6 +1168,7 @@ impl App {
         if !matches!(mouse.kind, MouseEventKind::Down(MouseButton::Left)) {
             return;
         }
+        self.needs_redraw = true;
 
         // Ignore clicks when modals are open
         if self.active_modal.is_some() || self.eq_visible {
@@ -677,18 +1191,11 @@ impl App {
         if row >= self.layout_tabs_area.y
             && row < self.layout_tabs_area.y + self.layout_tabs_area.height
         {
-            // Each tab renders as: [1 pad] title [1 pad] [divider " │ " = 3 chars]
-            let tab_titles = browser::TAB_TITLES;
-            let mut x = self.layout_tabs_area.x;
-            for (i, title) in tab_titles.iter().enumerate() {
-                let padding: u16 = 2;
-                let divider: u16 = if i < tab_titles.len() - 1 { 3 } else { 0 };
-                let tab_width = title.len() as u16 + padding + divider;
-                if col >= x && col < x + tab_width {
-                    self.switch_tab(i);
-                    return;
-                }
-                x += tab_width;
+            if let Some(tab) = col
+                .checked_sub(self.layout_tabs_area.x)
+                .and_then(browser::tab_at)
+            {
+                self.switch_tab(tab);
             }
             return;
         }
@@ -702,8 +1209,14 @@ impl App {
             self.focus = Focus::Browser;
             let content_start = self.layout_browser_area.y + 2;
             if row >= content_start {
-                let clicked_idx = (row - content_start) as usize;
-                if clicked_idx < self.current_tab_len() {
+                let len = self.current_tab_len();
+                let offset = browser::table_offset(
+                    len,
+                    self.tab_selected[self.active_tab],
+                    self.layout_browser_area,
+                );
+                let clicked_idx = offset + (row - content_start) as usize;
+                if clicked_idx < len {
                     self.tab_selected[self.active_tab] = Some(clicked_idx);
                     // Double-click triggers select (play/drill-down)
                     if is_double_click {
@@ -799,12 +1312,14 @@ impl App {
                     self.next_track();
                 } else if rel <= 13 {
                     self.queue_mgr.toggle_shuffle();
+                    self.save_playback_settings();
                 } else if rel <= 16 {
                     self.eq_visible = !self.eq_visible;
                 } else if rel < vol_end {
                     self.player.mute_toggle();
                 } else if rel >= right_start && rel < right_start + repeat_part_len {
                     self.queue_mgr.cycle_repeat();
+                    self.save_playback_settings();
                 } else if rel >= right_start + repeat_part_len + 3
                     && rel < right_start + right_total
                 {
@@ -816,20 +1331,29 @@ impl App {
 
     fn play_song(&mut self, song: &Song) {
         if let Some(client) = &self.client {
-            let url = client.stream_url(&song.id);
-            self.scrobble_reported = false;
+            let url = match self.preloaded.take() {
+                Some((id, url)) if id == song.id => url,
+                _ => client.stream_url(&song.id),
+            };
+            self.scrobble = ScrobbleState::new(song.duration);
+            self.next_prefetched = false;
             self.player.play(&url, song.clone());
             self.equalizer_state.apply(&mut self.player);
 
-            // Report now playing (fire-and-forget to avoid blocking UI)
-            let song_id = song.id.clone();
-            let base_url = client.base_url().to_string();
-            let username = client.username().to_string();
-            let password = client.password().to_string();
-            self.rt.spawn(async move {
-                let c = SubsonicClient::new(&base_url, &username, &password);
-                let _ = c.now_playing(&song_id).await;
-            });
+            self.report(Report::NowPlaying(song.id.clone()));
+
+            // Hidden lyrics are fetched when the panel is opened instead
+            if self.lyrics_visible {
+                self.load_lyrics();
+            }
+        }
+    }
+
+    /// Replace the queue with `songs` and start playing at `idx`.
+    fn play_list(&mut self, songs: Vec<Song>, idx: usize) {
+        self.queue_mgr.set_queue(songs, idx);
+        if let Some(song) = self.queue_mgr.current_song().cloned() {
+            self.play_song(&song);
         }
     }
 
@@ -850,17 +1374,26 @@ impl App {
         }
     }
 
+    /// Song list behind a song tab (Songs, Starred, History).
+    fn tab_songs(&mut self, tab: usize) -> Option<&[Song]> {
+        match tab {
+            2 => Some(&self.songs),
+            5 => Some(&self.starred_songs),
+            6 => Some(self.play_history.make_contiguous()),
+            _ => None,
+        }
+    }
+
+    /// Selected song on the active tab, if it is a song tab.
+    fn selected_song(&mut self) -> Option<&Song> {
+        let tab = self.active_tab;
+        let idx = self.tab_selected[tab]?;
+        self.tab_songs(tab)?.get(idx)
+    }
+
     fn add_selected_to_queue(&mut self) {
-        let songs = match self.active_tab {
-            2 => self.songs.clone(),
-            5 => self.starred_songs.clone(),
-            6 => self.play_history.clone(),
-            _ => return,
-        };
-        if let Some(idx) = self.tab_selected[self.active_tab]
-            && idx < songs.len()
-        {
-            self.queue_mgr.add(songs[idx].clone());
+        if let Some(song) = self.selected_song().cloned() {
+            self.queue_mgr.add(song);
         }
     }
 
@@ -908,6 +1441,7 @@ impl App {
                 let current = self.tab_selected[self.active_tab].unwrap_or(0) as i32;
                 let new_idx = (current + delta).clamp(0, len as i32 - 1) as usize;
                 self.tab_selected[self.active_tab] = Some(new_idx);
+                self.load_more_albums();
             }
             Focus::Queue => {
                 let len = self.queue_mgr.length();
@@ -950,74 +1484,35 @@ impl App {
                 };
                 match self.active_tab {
                     0 => {
-                        if idx < self.albums.len() {
-                            let album_id = self.albums[idx].id.clone();
-                            if let Some(client) = &self.client
-                                && let Ok((_, songs)) =
-                                    self.rt.block_on(client.get_album(&album_id))
-                            {
-                                self.push_nav();
-                                self.songs = songs;
-                                self.active_tab = 2;
-                                self.tab_selected[2] = Some(0);
-                            }
+                        if let Some(album) = self.albums.get(idx) {
+                            let album_id = album.id.clone();
+                            self.browse(BrowseRequest::Album(album_id));
                         }
                     }
                     1 => {
-                        if idx < self.artists.len() {
-                            let artist_id = self.artists[idx].id.clone();
-                            if let Some(client) = &self.client
-                                && let Ok((_, albums)) =
-                                    self.rt.block_on(client.get_artist(&artist_id))
-                            {
-                                self.push_nav();
-                                self.albums = albums;
-                                self.active_tab = 0;
-                                self.tab_selected[0] = Some(0);
-                            }
+                        if let Some(artist) = self.artists.get(idx) {
+                            let artist_id = artist.id.clone();
+                            self.browse(BrowseRequest::Artist(artist_id));
                         }
                     }
                     2 | 5 | 6 => {
-                        let songs = match self.active_tab {
-                            2 => &self.songs,
-                            5 => &self.starred_songs,
-                            6 => &self.play_history,
-                            _ => return,
-                        };
-                        if idx < songs.len() {
-                            let songs_clone = songs.to_vec();
-                            self.queue_mgr.set_queue(songs_clone, idx);
-                            if let Some(song) = self.queue_mgr.current_song().cloned() {
-                                self.play_song(&song);
-                            }
+                        if let Some(songs) = self.tab_songs(self.active_tab)
+                            && idx < songs.len()
+                        {
+                            let songs = songs.to_vec();
+                            self.play_list(songs, idx);
                         }
                     }
                     3 => {
-                        if idx < self.playlists.len() {
-                            let pl_id = self.playlists[idx].id.clone();
-                            if let Some(client) = &self.client
-                                && let Ok((_, songs)) =
-                                    self.rt.block_on(client.get_playlist(&pl_id))
-                            {
-                                self.push_nav();
-                                self.songs = songs;
-                                self.active_tab = 2;
-                                self.tab_selected[2] = Some(0);
-                            }
+                        if let Some(playlist) = self.playlists.get(idx) {
+                            let pl_id = playlist.id.clone();
+                            self.browse(BrowseRequest::Playlist(pl_id));
                         }
                     }
                     4 => {
-                        if idx < self.genres.len() {
-                            let genre = self.genres[idx].name.clone();
-                            if let Some(client) = &self.client
-                                && let Ok(songs) =
-                                    self.rt.block_on(client.get_songs_by_genre(&genre, 50, 0))
-                            {
-                                self.push_nav();
-                                self.songs = songs;
-                                self.active_tab = 2;
-                                self.tab_selected[2] = Some(0);
-                            }
+                        if let Some(genre) = self.genres.get(idx) {
+                            let genre = genre.name.clone();
+                            self.browse(BrowseRequest::Genre(genre));
                         }
                     }
                     _ => {}
@@ -1026,16 +1521,248 @@ impl App {
         }
     }
 
-    fn push_nav(&mut self) {
-        self.nav_history
-            .push((self.active_tab, self.tab_selected[self.active_tab]));
-        if self.nav_history.len() > 50 {
-            self.nav_history.remove(0);
+    /// Open a drill-down: at once if it was opened recently, otherwise once
+    /// the background fetch reaches `handle_fetch_result`.
+    fn browse(&mut self, request: BrowseRequest) {
+        let origin = (self.active_tab, self.tab_selected[self.active_tab]);
+        if let Some(view) = self.browse_cache.get(&request) {
+            let view = view.clone();
+            self.browse_seq += 1;
+            self.show_browse_view(origin, view);
+            return;
+        }
+        let Some(client) = self.client.clone() else {
+            return;
+        };
+        self.browse_seq += 1;
+        let seq = self.browse_seq;
+        let key = request.clone();
+        let fetch = async move {
+            match request {
+                BrowseRequest::Album(id) => client
+                    .get_album(&id)
+                    .await
+                    .map(|(_, songs)| BrowseView::Songs(songs)),
+                BrowseRequest::Artist(id) => client
+                    .get_artist(&id)
+                    .await
+                    .map(|(_, albums)| BrowseView::Albums(albums)),
+                BrowseRequest::Playlist(id) => client
+                    .get_playlist(&id)
+                    .await
+                    .map(|(_, songs)| BrowseView::Songs(songs)),
+                BrowseRequest::Genre(name) => client
+                    .get_songs_by_genre(&name, 50, 0)
+                    .await
+                    .map(BrowseView::Songs),
+            }
+        };
+        self.spawn_fetch(fetch, move |view| FetchResult::Browse {
+            seq,
+            origin,
+            request: key,
+            view,
+        });
+    }
+
+    fn show_browse_view(&mut self, origin: (usize, Option<usize>), view: BrowseView) {
+        self.push_nav(origin);
+        match view {
+            BrowseView::Songs(songs) => {
+                // No longer the tab's own list
+                self.tab_loaded_at[2] = None;
+                self.songs = songs;
+                self.active_tab = 2;
+                self.tab_selected[2] = Some(0);
+            }
+            BrowseView::Albums(albums) => self.set_artist_albums(albums),
+        }
+        self.needs_redraw = true;
+    }
+
+    /// Run `fetch` on the runtime and hand a successful result back to the
+    /// run loop through `fetch_rx`. Failures are dropped, which leaves the
+    /// current state as it was.
+    fn spawn_fetch<T, E, F>(&self, fetch: F, into: impl FnOnce(T) -> FetchResult + Send + 'static)
+    where
+        F: Future<Output = Result<T, E>> + Send + 'static,
+        T: Send + 'static,
+    {
+        let tx = self.fetch_tx.clone();
+        self.rt.spawn(async move {
+            if let Ok(value) = fetch.await {
+                let _ = tx.send(into(value));
+            }
+        });
+    }
+
+    fn handle_fetch_result(&mut self, result: FetchResult) {
+        match result {
+            FetchResult::Library {
+                seq,
+                browse_seq,
+                sort_index,
+                library,
+            } => {
+                if seq == self.library_seq {
+                    self.apply_library(browse_seq, sort_index, library);
+                }
+            }
+            FetchResult::Browse {
+                seq,
+                origin,
+                request,
+                view,
+            } => {
+                self.browse_cache.insert(request, view.clone());
+                // Superseded by a newer drill-down, tab switch or back
+                if seq == self.browse_seq {
+                    self.show_browse_view(origin, view);
+                }
+            }
+            FetchResult::Tab {
+                library_seq,
+                browse_seq,
+                list,
+            } => {
+                // Fetched from a server that has since been switched away from
+                if library_seq != self.library_seq {
+                    return;
+                }
+                let now = Some(Instant::now());
+                match list {
+                    TabList::Artists(artists) => {
+                        self.artists = artists;
+                        self.tab_loaded_at[1] = now;
+                    }
+                    TabList::Songs(songs) => {
+                        // A drill-down may have replaced the list since
+                        if browse_seq != self.browse_seq {
+                            return;
+                        }
+                        self.songs = songs;
+                        self.tab_loaded_at[2] = now;
+                    }
+                    TabList::Playlists(playlists) => {
+                        self.playlists = playlists;
+                        self.tab_loaded_at[3] = now;
+                    }
+                    TabList::Genres(genres) => {
+                        self.genres = genres;
+                        self.tab_loaded_at[4] = now;
+                    }
+                    TabList::Starred(songs) => {
+                        self.set_starred_songs(songs);
+                        self.tab_loaded_at[5] = now;
+                    }
+                }
+                self.needs_redraw = true;
+            }
+            FetchResult::Search {
+                query,
+                artists,
+                albums,
+                songs,
+            } => {
+                // Typing has moved on to another query
+                if query != self.search_query {
+                    return;
+                }
+                self.search_artists = artists;
+                self.search_albums = albums;
+                self.search_songs = songs;
+                self.search_selected = Some(0);
+                self.needs_redraw = true;
+            }
+            FetchResult::Lyrics { key, lyrics } => {
+                // Show them straight away if they are for the playing song
+                if self.lyrics_visible
+                    && let Some(song) = &self.player.current_song
+                    && self.lyrics_song_id.as_deref() != Some(song.id.as_str())
+                    && song.artist == key.0
+                    && song.title == key.1
+                {
+                    self.lyrics_text.clone_from(&lyrics);
+                    self.lyrics_scroll = 0;
+                    self.lyrics_song_id = Some(song.id.clone());
+                    self.needs_redraw = true;
+                }
+                self.lyrics_cache.insert(key, lyrics);
+            }
+            FetchResult::Albums { sort_index, albums } => {
+                // A later sort change is still on its way
+                if sort_index == self.album_sort_index {
+                    self.set_album_list(albums.clone());
+                    self.needs_redraw = true;
+                }
+                self.cache_album_list(sort_index, albums);
+            }
+            FetchResult::AlbumPage {
+                sort_index,
+                offset,
+                albums,
+            } => {
+                self.album_page_pending = false;
+                // Drop pages for a list that has since been replaced
+                if let Some(albums) = albums
+                    && self.album_pages_left
+                    && sort_index == self.album_sort_index
+                    && offset == self.albums.len()
+                {
+                    // Random ignores the offset, so a further page would
+                    // only repeat albums
+                    self.album_pages_left = albums.len() == ALBUM_PAGE_SIZE as usize
+                        && ALBUM_SORT_TYPES[sort_index] != ALBUM_SORT_RANDOM;
+                    self.albums.extend(albums);
+                    self.cache_album_list(sort_index, self.albums.clone());
+                    self.needs_redraw = true;
+                }
+            }
+            FetchResult::Radio(songs) => {
+                if !songs.is_empty() {
+                    self.play_list(songs, 0);
+                    self.needs_redraw = true;
+                }
+            }
+            FetchResult::RadioMore { head, songs } => {
+                // Only while the radio queue is still the one playing
+                if self.queue_mgr.queue().first().is_some_and(|s| s.id == head) {
+                    let more: Vec<Song> = songs
+                        .into_iter()
+                        .filter(|s| !self.queue_mgr.contains(&s.id))
+                        .collect();
+                    self.queue_mgr.add_songs(more);
+                    self.needs_redraw = true;
+                }
+            }
+            FetchResult::StarFailed { ids, starred } => {
+                for id in ids {
+                    if starred {
+                        self.starred_ids.insert(id);
+                    } else {
+                        self.starred_ids.remove(&id);
+                    }
+                }
+                // Only the ids came back, so the list itself is refetched
+                self.tab_loaded_at[5] = None;
+                if self.active_tab == 5 {
+                    self.reload_tab(5);
+                }
+                self.needs_redraw = true;
+            }
+        }
+    }
+
+    fn push_nav(&mut self, entry: (usize, Option<usize>)) {
+        self.nav_history.push_back(entry);
+        if self.nav_history.len() > MAX_NAV_HISTORY {
+            self.nav_history.pop_front();
         }
     }
 
     fn go_back(&mut self) {
-        if let Some((tab, sel)) = self.nav_history.pop() {
+        self.browse_seq += 1;
+        if let Some((tab, sel)) = self.nav_history.pop_back() {
             self.active_tab = tab;
             self.tab_selected[tab] = sel;
             self.reload_tab(tab);
@@ -1046,30 +1773,56 @@ impl App {
         if tab == self.active_tab {
             return;
         }
+        self.browse_seq += 1;
         self.active_tab = tab;
         self.reload_tab(tab);
     }
 
+    /// Refetch the list behind a browser tab, unless it was fetched within
+    /// `TAB_DATA_TTL`. Failed requests keep the current list.
     fn reload_tab(&mut self, tab: usize) {
+        if self.tab_loaded_at[tab].is_some_and(|at| at.elapsed() < TAB_DATA_TTL) {
+            return;
+        }
+        if tab == 0 {
+            self.load_library_data();
+            return;
+        }
+        let Some(client) = self.client.clone() else {
+            return;
+        };
+        let library_seq = self.library_seq;
+        let browse_seq = self.browse_seq;
+        let into = move |list| FetchResult::Tab {
+            library_seq,
+            browse_seq,
+            list,
+        };
         match tab {
-            0 => self.load_library_data(),
-            1 => self.load_artists(),
-            2 => self.load_songs(),
-            3 => self.load_playlists(),
-            4 => self.load_genres(),
-            5 => self.load_starred(),
+            1 => self.spawn_fetch(
+                async move { client.get_artists().await.map(TabList::Artists) },
+                into,
+            ),
+            2 => self.spawn_fetch(
+                async move { client.get_random_songs(50, "").await.map(TabList::Songs) },
+                into,
+            ),
+            3 => self.spawn_fetch(
+                async move { client.get_playlists().await.map(TabList::Playlists) },
+                into,
+            ),
+            4 => self.spawn_fetch(
+                async move { client.get_genres().await.map(TabList::Genres) },
+                into,
+            ),
+            5 => self.spawn_fetch(
+                async move { client.get_starred_songs().await.map(TabList::Starred) },
+                into,
+            ),
             _ => {}
         }
     }
 
-    fn load_songs(&mut self) {
-        if let Some(client) = &self.client
-            && let Ok(songs) = self.rt.block_on(client.get_random_songs(50, ""))
-        {
-            self.songs = songs;
-        }
-    }
-
     fn cycle_focus(&mut self) {
         self.focus = match self.focus {
             Focus::Browser => Focus::Queue,
@@ -1086,92 +1839,173 @@ impl App {
         self.load_library_data();
     }
 
-    fn load_artists(&mut self) {
-        if let Some(client) = &self.client
-            && let Ok(artists) = self.rt.block_on(client.get_artists())
-        {
-            self.artists = artists;
+    /// Replace the starred list, refilling the ID set in place. Toggles
+    /// not yet sent to the server are applied on top of its list.
+    fn set_starred_songs(&mut self, mut songs: Vec<Song>) {
+        if !self.pending_stars.is_empty() {
+            songs.retain(|s| self.pending_stars.get(&s.id) != Some(&false));
+            // Pending stars were patched into the list being replaced
+            for song in &self.starred_songs {
+                if self.pending_stars.get(&song.id) == Some(&true)
+                    && !songs.iter().any(|s| s.id == song.id)
+                {
+                    songs.push(song.clone());
+                }
+            }
+            if let Some(sel) = self.tab_selected[5]
+                && sel >= songs.len()
+            {
+                self.tab_selected[5] = Some(songs.len().saturating_sub(1));
+            }
         }
+        self.starred_ids.clear();
+        self.starred_ids.extend(songs.iter().map(|s| s.id.clone()));
+        self.starred_songs = songs;
     }
 
-    fn load_playlists(&mut self) {
-        if let Some(client) = &self.client
-            && let Ok(playlists) = self.rt.block_on(client.get_playlists())
-        {
-            self.playlists = playlists;
+    /// Get the next track ready while this one finishes: open its stream,
+    /// and while the lyrics panel is open, fetch its lyrics into the cache.
+    fn prefetch_next(&mut self) {
+        let (Some(client), Some(song)) = (self.client.clone(), self.queue_mgr.peek_next()) else {
+            return;
+        };
+        // The URL carries a fresh salt each time, so play_song must reuse it
+        let url = client.stream_url(&song.id);
+        self.player.preload(&url);
+        self.preloaded = Some((song.id.clone(), url));
+
+        if !self.lyrics_visible {
+            return;
+        }
+        let key = (song.artist.clone(), song.title.clone());
+        if self.lyrics_cache.contains(&key) {
+            return;
         }
+        let (artist, title) = key.clone();
+        self.spawn_fetch(
+            async move { client.get_lyrics(&artist, &title).await },
+            move |lyrics| FetchResult::Lyrics { key, lyrics },
+        );
     }
 
-    fn load_genres(&mut self) {
-        if let Some(client) = &self.client
-            && let Ok(genres) = self.rt.block_on(client.get_genres())
-        {
-            self.genres = genres;
+    /// Show lyrics for the current song, unless they are already shown.
+    fn load_lyrics(&mut self) {
+        let Some(song) = &self.player.current_song else {
+            return;
+        };
+        if self.lyrics_song_id.as_deref() == Some(song.id.as_str()) {
+            return;
+        }
+        let song_id = song.id.clone();
+        let key = (song.artist.clone(), song.title.clone());
+        if let Some(lyrics) = self.lyrics_cache.get(&key) {
+            self.lyrics_text.clone_from(lyrics);
+            self.lyrics_scroll = 0;
+            self.lyrics_song_id = Some(song_id);
+            return;
+        }
+        // The previous song's lyrics must not linger while these load
+        self.lyrics_text.clear();
+        self.lyrics_scroll = 0;
+        if let Some(client) = self.client.clone() {
+            let (artist, title) = key.clone();
+            self.spawn_fetch(
+                async move { client.get_lyrics(&artist, &title).await },
+                move |lyrics| FetchResult::Lyrics { key, lyrics },
+            );
         }
     }
 
-    fn load_starred(&mut self) {
-        if let Some(client) = &self.client
-            && let Ok((_, _, songs)) = self.rt.block_on(client.get_starred())
+    fn toggle_star(&mut self) {
+        let song = self.selected_song().cloned();
+
+        // Flip the star right away and send it with the next batch
+        if let Some(song) = song
+            && self.client.is_some()
         {
-            self.starred_ids = songs.iter().map(|s| s.id.clone()).collect();
-            self.starred_songs = songs;
+            let id = song.id.clone();
+            let star = !self.starred_ids.contains(&id);
+            self.patch_starred(song, star);
+            // Toggling twice before the flush cancels out
+            if self.pending_stars.remove(&id).is_none() {
+                self.pending_stars.insert(id, star);
+            }
+            self.star_flush_at
+                .get_or_insert_with(|| Instant::now() + STAR_FLUSH_DELAY);
         }
     }
 
-    fn load_lyrics(&mut self) {
-        if let Some(song) = &self.player.current_song
-            && let Some(client) = &self.client
-        {
-            let artist = song.artist.clone();
-            let title = song.title.clone();
-            if let Ok(lyrics) = self.rt.block_on(client.get_lyrics(&artist, &title)) {
-                self.lyrics_text = lyrics;
-                self.lyrics_scroll = 0;
+    /// Add a song to or drop it from the starred list in place, so the
+    /// Starred tab stays current without fetching it again.
+    fn patch_starred(&mut self, song: Song, star: bool) {
+        if star {
+            self.starred_ids.insert(song.id.clone());
+            self.starred_songs.push(song);
+        } else {
+            self.starred_ids.remove(&song.id);
+            self.starred_songs.retain(|s| s.id != song.id);
+            if let Some(sel) = self.tab_selected[5]
+                && sel >= self.starred_songs.len()
+            {
+                self.tab_selected[5] = Some(self.starred_songs.len().saturating_sub(1));
             }
         }
     }
 
-    fn toggle_star(&mut self) {
-        let song_id = match self.active_tab {
-            2 | 5 | 6 => {
-                let songs = match self.active_tab {
-                    2 => &self.songs,
-                    5 => &self.starred_songs,
-                    6 => &self.play_history,
-                    _ => return,
-                };
-                self.tab_selected[self.active_tab]
-                    .and_then(|idx| songs.get(idx))
-                    .map(|s| s.id.clone())
-            }
-            _ => None,
+    /// Send the star changes collected since the last flush, one request
+    /// per direction. A failed batch flips its songs back.
+    fn flush_stars(&mut self) -> Vec<tokio::task::JoinHandle<()>> {
+        self.star_flush_at = None;
+        let Some(client) = self.client.clone() else {
+            self.pending_stars.clear();
+            return Vec::new();
         };
-
-        if let (Some(id), Some(client)) = (song_id, &self.client) {
-            if self.starred_ids.contains(&id) {
-                let _ = self.rt.block_on(client.unstar(&id));
-                self.starred_ids.remove(&id);
-            } else {
-                let _ = self.rt.block_on(client.star(&id));
-                self.starred_ids.insert(id);
+        let (star, unstar): (Vec<_>, Vec<_>) = self.pending_stars.drain().partition(|&(_, s)| s);
+        let mut handles = Vec::new();
+        for (batch, starred) in [(star, true), (unstar, false)] {
+            if batch.is_empty() {
+                continue;
             }
+            let ids: Vec<String> = batch.into_iter().map(|(id, _)| id).collect();
+            let client = client.clone();
+            let tx = self.fetch_tx.clone();
+            handles.push(self.rt.spawn(async move {
+                let result = if starred {
+                    client.star_many(&ids).await
+                } else {
+                    client.unstar_many(&ids).await
+                };
+                if result.is_err() {
+                    let _ = tx.send(FetchResult::StarFailed {
+                        ids,
+                        starred: !starred,
+                    });
+                }
+            }));
         }
+        handles
     }
 
     fn start_radio(&mut self) {
         if let Some(song) = &self.player.current_song
-            && let Some(client) = &self.client
+            && let Some(client) = self.client.clone()
         {
             let song_id = song.id.clone();
-            if let Ok(songs) = self.rt.block_on(client.get_similar_songs(&song_id, 50))
-                && !songs.is_empty()
-            {
-                self.queue_mgr.set_queue(songs, 0);
-                if let Some(song) = self.queue_mgr.current_song().cloned() {
-                    self.play_song(&song);
+            let tx = self.fetch_tx.clone();
+            self.rt.spawn(async move {
+                let Ok(first) = client.get_similar_songs(&song_id, RADIO_FIRST_BATCH).await else {
+                    return;
+                };
+                let Some(head) = first.first().map(|s| s.id.clone()) else {
+                    return;
+                };
+                if tx.send(FetchResult::Radio(first)).is_err() {
+                    return;
                 }
-            }
+                if let Ok(songs) = client.get_similar_songs(&song_id, RADIO_SIZE).await {
+                    let _ = tx.send(FetchResult::RadioMore { head, songs });
+                }
+            });
         }
     }
 
@@ -1227,16 +2061,22 @@ impl App {
     }
 
     fn do_search(&mut self) {
-        if let Some(client) = &self.client
-            && let Ok((artists, albums, songs)) =
-                self.rt
-                    .block_on(client.search(&self.search_query, 10, 10, 20))
-        {
-            self.search_artists = artists;
-            self.search_albums = albums;
-            self.search_songs = songs;
-            self.search_selected = Some(0);
-        }
+        let Some(client) = self.client.clone() else {
+            return;
+        };
+        let query = self.search_query.clone();
+        self.spawn_fetch(
+            async move {
+                let results = client.search(&query, 10, 10, 20).await;
+                results.map(|results| (query, results))
+            },
+            |(query, (artists, albums, songs))| FetchResult::Search {
+                query,
+                artists,
+                albums,
+                songs,
+            },
+        );
     }
 
     fn select_search_result(&mut self) {
@@ -1245,34 +2085,19 @@ impl App {
             0 => {
                 if idx < self.search_songs.len() {
                     let songs = self.search_songs.clone();
-                    self.queue_mgr.set_queue(songs, idx);
-                    if let Some(song) = self.queue_mgr.current_song().cloned() {
-                        self.play_song(&song);
-                    }
+                    self.play_list(songs, idx);
                 }
             }
             1 => {
-                if idx < self.search_albums.len() {
-                    let album_id = self.search_albums[idx].id.clone();
-                    if let Some(client) = &self.client
-                        && let Ok((_, songs)) = self.rt.block_on(client.get_album(&album_id))
-                    {
-                        self.songs = songs;
-                        self.active_tab = 2;
-                        self.tab_selected[2] = Some(0);
-                    }
+                if let Some(album) = self.search_albums.get(idx) {
+                    let album_id = album.id.clone();
+                    self.browse(BrowseRequest::Album(album_id));
                 }
             }
             2 => {
-                if idx < self.search_artists.len() {
-                    let artist_id = self.search_artists[idx].id.clone();
-                    if let Some(client) = &self.client
-                        && let Ok((_, albums)) = self.rt.block_on(client.get_artist(&artist_id))
-                    {
-                        self.albums = albums;
-                        self.active_tab = 0;
-                        self.tab_selected[0] = Some(0);
-                    }
+                if let Some(artist) = self.search_artists.get(idx) {
+                    let artist_id = artist.id.clone();
+                    self.browse(BrowseRequest::Artist(artist_id));
                 }
             }
             _ => {}
@@ -1321,9 +2146,8 @@ impl App {
                     && idx < self.config.servers.len()
                 {
                     self.config.set_active_server(idx);
-                    self.config.save();
                     self.connect_to_active_server();
-                    self.load_library_data();
+                    self.load_all_library_data();
                     let name = self.config.servers[idx].name.clone();
                     self.server_status = format!("Switched to '{name}'");
                 }
@@ -1346,7 +2170,7 @@ impl App {
                     Ok(true) => {
                         self.config.add_server(&name, &url, &username, &password);
                         self.connect_to_active_server();
-                        self.load_library_data();
+                        self.load_all_library_data();
                         self.server_form = Default::default();
                         self.server_status = format!("Server '{name}' added successfully");
                         self.server_selected = Some(self.config.servers.len().saturating_sub(1));
@@ -1395,3 +2219,100 @@ fn centered_rect(percent_x: u16, percent_y: u16, area: Rect) -> Rect {
     ])
     .split(popup_layout[1])[1]
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn test_app() -> (tempfile::TempDir, App) {
+        let dir = tempfile::tempdir().unwrap();
+        let app = App::new(AppConfig::load_from(dir.path()));
+        (dir, app)
+    }
+
+    fn song(id: &str) -> Song {
+        Song {
+            id: id.to_string(),
+            ..Default::default()
+        }
+    }
+
+    fn album(id: &str) -> Album {
+        Album {
+            id: id.to_string(),
+            ..Default::default()
+        }
+    }
+
+    fn library(albums: Vec<Album>, songs: Vec<Song>) -> Library {
+        Library {
+            albums: Some(albums),
+            artists: None,
+            songs: Some(songs),
+            playlists: None,
+            genres: None,
+            starred: None,
+        }
+    }
+
+    /// Result of the library load started by `load_all_library_data`, as
+    /// tagged at that moment.
+    fn library_result(app: &App, library: Library) -> FetchResult {
+        FetchResult::Library {
+            seq: app.library_seq,
+            browse_seq: app.browse_seq,
+            sort_index: app.album_sort_index,
+            library,
+        }
+    }
+
+    fn ids<T>(items: &[T], id: impl Fn(&T) -> &str) -> Vec<&str> {
+        items.iter().map(id).collect()
+    }
+
+    #[test]
+    fn test_library_load_fills_lists() {
+        let (_dir, mut app) = test_app();
+        app.load_all_library_data();
+        let result = library_result(&app, library(vec![album("al1")], vec![song("random")]));
+        app.handle_fetch_result(result);
+        assert_eq!(ids(&app.albums, |a| &a.id), ["al1"]);
+        assert_eq!(ids(&app.songs, |s| &s.id), ["random"]);
+    }
+
+    #[test]
+    fn test_album_browse_survives_pending_library_load() {
+        let (_dir, mut app) = test_app();
+        app.load_all_library_data();
+        let result = library_result(&app, library(vec![album("al1")], vec![song("random")]));
+
+        let request = BrowseRequest::Album("al1".to_string());
+        app.browse_cache
+            .insert(request.clone(), BrowseView::Songs(vec![song("track")]));
+        app.browse(request);
+        app.handle_fetch_result(result);
+
+        assert_eq!(app.active_tab, 2);
+        assert_eq!(ids(&app.songs, |s| &s.id), ["track"]);
+        // The albums still reach the cache for the next visit to the tab
+        assert!(app.album_lists.get(&app.album_sort_index).is_some());
+    }
+
+    #[test]
+    fn test_artist_browse_survives_pending_library_load() {
+        let (_dir, mut app) = test_app();
+        app.load_all_library_data();
+        let result = library_result(&app, library(vec![album("newest")], vec![song("random")]));
+
+        let request = BrowseRequest::Artist("ar1".to_string());
+        app.browse_cache.insert(
+            request.clone(),
+            BrowseView::Albums(vec![album("by_artist")]),
+        );
+        app.browse(request);
+        app.handle_fetch_result(result);
+
+        assert_eq!(app.active_tab, 0);
+        assert_eq!(ids(&app.albums, |a| &a.id), ["by_artist"]);
+    }
+}
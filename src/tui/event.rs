@@ -56,4 +56,9 @@ impl EventHandler {
     pub fn next(&self) -> Result<AppEvent, mpsc::RecvError> {
         self.rx.recv()
     }
+
+    /// Next event if one is already waiting.
+    pub fn try_next(&self) -> Option<AppEvent> {
+        self.rx.try_recv().ok()
+    }
 }
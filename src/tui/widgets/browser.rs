@@ -1,3 +1,5 @@
+use std::ops::Range;
+
 use ratatui::Frame;
 use ratatui::layout::{Constraint, Rect};
 use ratatui::style::{Modifier, Style};
@@ -18,6 +20,28 @@ pub const TAB_TITLES: &[&str] = &[
     "History",
 ];
 
+/// Right edge of each tab, counted from the left of the tab bar. A tab is
+/// its title padded by a column either side, then the " │ " divider.
+const TAB_ENDS: [u16; TAB_TITLES.len()] = {
+    let mut ends = [0; TAB_TITLES.len()];
+    let mut x = 0;
+    let mut i = 0;
+    while i < TAB_TITLES.len() {
+        x += TAB_TITLES[i].len() as u16 + 2;
+        if i + 1 < TAB_TITLES.len() {
+            x += 3;
+        }
+        ends[i] = x;
+        i += 1;
+    }
+    ends
+};
+
+/// Tab under column `x` of the tab bar.
+pub fn tab_at(x: u16) -> Option<usize> {
+    TAB_ENDS.iter().position(|&end| x < end)
+}
+
 pub fn render_tabs(f: &mut Frame, area: Rect, active_tab: usize) {
     let titles: Vec<Span> = TAB_TITLES
         .iter()
@@ -43,8 +67,36 @@ pub fn render_tabs(f: &mut Frame, area: Rect, active_tab: usize) {
     f.render_widget(tabs, area);
 }
 
+/// First row shown when a table in `area` is scrolled just far enough to
+/// keep `selected` in view, which is what a fresh `TableState` does.
+pub fn table_offset(len: usize, selected: Option<usize>, area: Rect) -> usize {
+    // Header row plus its bottom margin
+    let height = (area.height.saturating_sub(2) as usize).max(1);
+    match selected {
+        Some(sel) if len > 0 => (sel.min(len - 1) + 1).saturating_sub(height),
+        _ => 0,
+    }
+}
+
+/// Rows that fit on screen, and the selection relative to them. Only
+/// these rows are built, however long the list is. A selection past the
+/// end lands on the last row.
+pub fn visible_window(
+    len: usize,
+    selected: Option<usize>,
+    area: Rect,
+) -> (Range<usize>, Option<usize>) {
+    let offset = table_offset(len, selected, area);
+    let end = (offset + area.height.saturating_sub(2) as usize).min(len);
+    let selected = selected
+        .filter(|_| len > 0)
+        .map(|s| s.min(len - 1) - offset);
+    (offset..end, selected)
+}
+
 pub fn render_albums_table(f: &mut Frame, area: Rect, albums: &[Album], selected: Option<usize>) {
-    let rows: Vec<Row> = albums
+    let (window, selected) = visible_window(albums.len(), selected, area);
+    let rows: Vec<Row> = albums[window]
         .iter()
         .map(|a| {
             Row::new(vec![
@@ -87,7 +139,8 @@ pub fn render_artists_table(
     artists: &[Artist],
     selected: Option<usize>,
 ) {
-    let rows: Vec<Row> = artists
+    let (window, selected) = visible_window(artists.len(), selected, area);
+    let rows: Vec<Row> = artists[window]
         .iter()
         .map(|a| {
             Row::new(vec![
@@ -113,13 +166,28 @@ pub fn render_artists_table(
     f.render_stateful_widget(table, area, &mut state);
 }
 
-pub fn render_songs_table(f: &mut Frame, area: Rect, songs: &[Song], selected: Option<usize>) {
-    let rows: Vec<Row> = songs
+/// Song rows are numbered; the number of a song already in the queue is
+/// highlighted.
+pub fn render_songs_table(
+    f: &mut Frame,
+    area: Rect,
+    songs: &[Song],
+    selected: Option<usize>,
+    queued: impl Fn(&str) -> bool,
+) {
+    let (window, selected) = visible_window(songs.len(), selected, area);
+    let first = window.start;
+    let rows: Vec<Row> = songs[window]
         .iter()
         .enumerate()
         .map(|(i, s)| {
+            let number_style = if queued(&s.id) {
+                Style::default().fg(theme::PRIMARY)
+            } else {
+                Style::default()
+            };
             Row::new(vec![
-                Cell::from(format!("{}", i + 1)),
+                Cell::from(format!("{}", first + i + 1)).style(number_style),
                 Cell::from(s.title.as_str()),
                 Cell::from(s.artist.as_str()),
                 Cell::from(s.album.as_str()),
@@ -156,7 +224,8 @@ pub fn render_playlists_table(
     playlists: &[Playlist],
     selected: Option<usize>,
 ) {
-    let rows: Vec<Row> = playlists
+    let (window, selected) = visible_window(playlists.len(), selected, area);
+    let rows: Vec<Row> = playlists[window]
         .iter()
         .map(|p| {
             Row::new(vec![
@@ -188,7 +257,8 @@ pub fn render_playlists_table(
 }
 
 pub fn render_genres_table(f: &mut Frame, area: Rect, genres: &[Genre], selected: Option<usize>) {
-    let rows: Vec<Row> = genres
+    let (window, selected) = visible_window(genres.len(), selected, area);
+    let rows: Vec<Row> = genres[window]
         .iter()
         .map(|g| {
             Row::new(vec![
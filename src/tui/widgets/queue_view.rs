@@ -12,6 +12,7 @@ pub fn render(
     f: &mut Frame,
     area: Rect,
     queue: &[Song],
+    total_duration: u64,
     current_index: i32,
     selected: Option<usize>,
 ) {
@@ -35,7 +36,6 @@ pub fn render(
     .split(inner);
 
     // Info line
-    let total_duration: u64 = queue.iter().map(|s| s.duration).sum();
     let info = Line::from(vec![
         Span::styled(
             format!(" {} songs", queue.len()),
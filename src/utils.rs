@@ -48,6 +48,16 @@ pub fn truncate(text: &str, max_len: usize) -> String {
     }
 }
 
+/// Playback position in seconds at which a track counts as listened to:
+/// halfway through, but no later than four minutes in.
+pub fn scrobble_threshold(duration_secs: f64) -> f64 {
+    if duration_secs > 0.0 {
+        (duration_secs * 0.5).min(240.0)
+    } else {
+        240.0
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -81,4 +91,11 @@ mod tests {
         assert_eq!(truncate("hello world", 8), "hello...");
         assert_eq!(truncate("ab", 2), "ab");
     }
+
+    #[test]
+    fn test_scrobble_threshold() {
+        assert_eq!(scrobble_threshold(200.0), 100.0);
+        assert_eq!(scrobble_threshold(600.0), 240.0);
+        assert_eq!(scrobble_threshold(0.0), 240.0);
+    }
 }
@@ -0,0 +1,77 @@
+use cli_music_player::tui::widgets::browser::{tab_at, table_offset, visible_window};
+use ratatui::layout::Rect;
+
+/// A table area with room for `rows` rows under the header.
+fn area(rows: u16) -> Rect {
+    Rect::new(0, 0, 80, rows + 2)
+}
+
+// ── Table Window Tests ──────────────────────────────────────────
+
+#[test]
+fn test_table_offset_empty_list() {
+    assert_eq!(table_offset(0, None, area(10)), 0);
+    assert_eq!(table_offset(0, Some(5), area(10)), 0);
+}
+
+#[test]
+fn test_visible_window_empty_list() {
+    assert_eq!(visible_window(0, None, area(10)), (0..0, None));
+    assert_eq!(visible_window(0, Some(3), area(10)), (0..0, None));
+}
+
+#[test]
+fn test_visible_window_short_list_shows_everything() {
+    assert_eq!(visible_window(5, Some(2), area(10)), (0..5, Some(2)));
+}
+
+#[test]
+fn test_visible_window_selection_past_end() {
+    // Lands on the last row, scrolled so it is visible
+    assert_eq!(table_offset(100, Some(500), area(10)), 90);
+    assert_eq!(visible_window(100, Some(500), area(10)), (90..100, Some(9)));
+    assert_eq!(visible_window(5, Some(50), area(10)), (0..5, Some(4)));
+}
+
+#[test]
+fn test_visible_window_selection_at_bottom_edge() {
+    // Last row that fits without scrolling
+    assert_eq!(visible_window(100, Some(9), area(10)), (0..10, Some(9)));
+    // One past it scrolls by one row
+    assert_eq!(visible_window(100, Some(10), area(10)), (1..11, Some(9)));
+    assert_eq!(visible_window(100, Some(15), area(10)), (6..16, Some(9)));
+}
+
+#[test]
+fn test_visible_window_no_selection() {
+    assert_eq!(visible_window(100, None, area(10)), (0..10, None));
+}
+
+#[test]
+fn test_table_offset_tiny_area() {
+    // Too short to show any rows still keeps the selection as the first row
+    assert_eq!(table_offset(100, Some(20), Rect::new(0, 0, 80, 1)), 20);
+}
+
+// ── Tab Hit-Test Tests ──────────────────────────────────────────
+
+#[test]
+fn test_tab_at_first_tab() {
+    assert_eq!(tab_at(0), Some(0));
+    // " Albums " plus the " │ " divider
+    assert_eq!(tab_at(10), Some(0));
+}
+
+#[test]
+fn test_tab_at_boundaries() {
+    assert_eq!(tab_at(11), Some(1));
+    assert_eq!(tab_at(22), Some(1));
+    assert_eq!(tab_at(23), Some(2));
+}
+
+#[test]
+fn test_tab_at_last_tab_and_past_it() {
+    assert_eq!(tab_at(78), Some(6));
+    assert_eq!(tab_at(79), None);
+    assert_eq!(tab_at(u16::MAX), None);
+}
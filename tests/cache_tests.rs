@@ -0,0 +1,92 @@
+use std::time::Duration;
+
+use cli_music_player::cache::{BoundedCache, TtlCache};
+
+// ── BoundedCache Tests ──────────────────────────────────────────
+
+#[test]
+fn test_bounded_cache_insert_and_get() {
+    let mut cache = BoundedCache::new(4);
+    cache.insert("a".to_string(), 1);
+    cache.insert("b".to_string(), 2);
+    assert_eq!(cache.get("a"), Some(&1));
+    assert_eq!(cache.get("b"), Some(&2));
+    assert_eq!(cache.get("c"), None);
+    assert_eq!(cache.len(), 2);
+}
+
+#[test]
+fn test_bounded_cache_evicts_oldest() {
+    let mut cache = BoundedCache::new(2);
+    cache.insert(1, "one");
+    cache.insert(2, "two");
+    cache.insert(3, "three");
+    assert!(!cache.contains(&1));
+    assert!(cache.contains(&2));
+    assert!(cache.contains(&3));
+    assert_eq!(cache.len(), 2);
+}
+
+#[test]
+fn test_bounded_cache_replace_keeps_size() {
+    let mut cache = BoundedCache::new(2);
+    cache.insert(1, "one");
+    cache.insert(1, "uno");
+    cache.insert(2, "two");
+    assert_eq!(cache.get(&1), Some(&"uno"));
+    assert_eq!(cache.len(), 2);
+}
+
+#[test]
+fn test_bounded_cache_tuple_keys() {
+    let mut cache = BoundedCache::new(8);
+    let key = ("Artist".to_string(), "Title".to_string());
+    cache.insert(key.clone(), String::new());
+    // Empty values are cached too (known-missing lyrics)
+    assert_eq!(cache.get(&key).map(String::as_str), Some(""));
+}
+
+#[test]
+fn test_bounded_cache_clear() {
+    let mut cache = BoundedCache::new(2);
+    cache.insert(1, 1);
+    cache.clear();
+    assert!(cache.is_empty());
+    cache.insert(2, 2);
+    cache.insert(3, 3);
+    assert_eq!(cache.len(), 2);
+}
+
+#[test]
+fn test_bounded_cache_zero_capacity_holds_one() {
+    let mut cache = BoundedCache::new(0);
+    cache.insert(1, 1);
+    cache.insert(2, 2);
+    assert_eq!(cache.len(), 1);
+    assert!(cache.contains(&2));
+}
+
+// ── TtlCache Tests ──────────────────────────────────────────────
+
+#[test]
+fn test_ttl_cache_returns_fresh_entries() {
+    let mut cache = TtlCache::new(4, Duration::from_secs(60));
+    cache.insert("albums", vec![1, 2, 3]);
+    assert_eq!(cache.get("albums"), Some(&vec![1, 2, 3]));
+    assert_eq!(cache.get("artists"), None);
+}
+
+#[test]
+fn test_ttl_cache_hides_expired_entries() {
+    let mut cache = TtlCache::new(4, Duration::ZERO);
+    cache.insert("albums", 1);
+    assert_eq!(cache.get("albums"), None);
+}
+
+#[test]
+fn test_ttl_cache_clear() {
+    let mut cache = TtlCache::new(4, Duration::from_secs(60));
+    cache.insert(1, "one");
+    cache.clear();
+    assert_eq!(cache.get(&1), None);
+}
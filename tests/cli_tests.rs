@@ -0,0 +1,57 @@
+use std::path::PathBuf;
+
+use clap::CommandFactory;
+use cli_music_player::cli::{Cli, HELP};
+
+fn args(list: &[&str]) -> Vec<String> {
+    list.iter().map(|s| s.to_string()).collect()
+}
+
+// ── Argument Scan Tests ─────────────────────────────────────────
+
+#[test]
+fn test_scan_no_args() {
+    let cli = Cli::scan(&[]).unwrap();
+    assert!(cli.config_dir.is_none());
+    assert!(cli.server.is_none());
+}
+
+#[test]
+fn test_scan_separate_values() {
+    let cli = Cli::scan(&args(&["--config-dir", "/tmp/cfg", "--server", "Home"])).unwrap();
+    assert_eq!(cli.config_dir, Some(PathBuf::from("/tmp/cfg")));
+    assert_eq!(cli.server.as_deref(), Some("Home"));
+}
+
+#[test]
+fn test_scan_equals_values() {
+    let cli = Cli::scan(&args(&["--server=My Server", "--config-dir=/tmp/cfg"])).unwrap();
+    assert_eq!(cli.config_dir, Some(PathBuf::from("/tmp/cfg")));
+    assert_eq!(cli.server.as_deref(), Some("My Server"));
+}
+
+#[test]
+fn test_scan_last_value_wins() {
+    let cli = Cli::scan(&args(&["--server", "A", "--server", "B"])).unwrap();
+    assert_eq!(cli.server.as_deref(), Some("B"));
+}
+
+#[test]
+fn test_scan_missing_value_defers_to_clap() {
+    assert!(Cli::scan(&args(&["--server"])).is_none());
+    assert!(Cli::scan(&args(&["--config-dir"])).is_none());
+}
+
+#[test]
+fn test_scan_unknown_flag_defers_to_clap() {
+    assert!(Cli::scan(&args(&["--verbose"])).is_none());
+    assert!(Cli::scan(&args(&["--help"])).is_none());
+    assert!(Cli::scan(&args(&["positional"])).is_none());
+}
+
+// ── Help Text Tests ─────────────────────────────────────────────
+
+#[test]
+fn test_help_matches_clap() {
+    assert_eq!(HELP, Cli::command().render_help().to_string());
+}
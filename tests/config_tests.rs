@@ -62,14 +62,14 @@ fn test_encrypt_long_password() {
 // ── ServerConfig Tests ──────────────────────────────────────────
 
 #[test]
-fn test_server_config_to_value() {
+fn test_server_config_serialize() {
     let server = ServerConfig {
         name: "Test Server".to_string(),
         url: "https://music.example.com".to_string(),
         username: "admin".to_string(),
         encrypted_password: "encrypted123".to_string(),
     };
-    let value = server.to_value();
+    let value = serde_json::to_value(&server).unwrap();
     assert_eq!(value["name"], "Test Server");
     assert_eq!(value["url"], "https://music.example.com");
     assert_eq!(value["username"], "admin");
@@ -112,12 +112,12 @@ fn test_server_config_from_value_invalid() {
 // ── EQPreset Tests ──────────────────────────────────────────────
 
 #[test]
-fn test_eq_preset_to_value() {
+fn test_eq_preset_serialize() {
     let preset = EQPreset {
         name: "Custom".to_string(),
         gains: vec![1.0; 18],
     };
-    let value = preset.to_value();
+    let value = serde_json::to_value(&preset).unwrap();
     assert_eq!(value["name"], "Custom");
     assert_eq!(value["gains"].as_array().unwrap().len(), 18);
 }
@@ -229,6 +229,71 @@ fn test_app_config_save_and_load() {
     }
 }
 
+#[test]
+fn test_app_config_snapshot_writes_state_when_taken() {
+    let dir = tempdir().unwrap();
+    let mut config = AppConfig::load_from(dir.path());
+    config.volume = 40;
+    let snapshot = config.snapshot();
+    config.volume = 90;
+
+    snapshot.write();
+    let loaded = AppConfig::load_from(dir.path());
+    assert_eq!(loaded.volume, 40);
+}
+
+#[test]
+fn test_app_config_older_snapshot_does_not_undo_later_save() {
+    let dir = tempdir().unwrap();
+    let mut config = AppConfig::load_from(dir.path());
+    let snapshot = config.snapshot();
+    config.add_server("Home", "https://example.com", "user", "pass");
+
+    // A background write landing after the direct save changes nothing
+    snapshot.write();
+    let loaded = AppConfig::load_from(dir.path());
+    assert_eq!(loaded.servers.len(), 1);
+}
+
+#[test]
+fn test_app_config_save_leaves_no_temp_file() {
+    let dir = tempdir().unwrap();
+    let mut config = AppConfig::load_from(dir.path());
+    config.volume = 55;
+    config.save();
+    config.volume = 65;
+    config.save();
+
+    let leftovers = std::fs::read_dir(dir.path())
+        .unwrap()
+        .filter_map(|entry| entry.ok())
+        .filter(|entry| entry.file_name().to_string_lossy().ends_with(".tmp"))
+        .count();
+    assert_eq!(leftovers, 0);
+    let loaded = AppConfig::load_from(dir.path());
+    assert_eq!(loaded.volume, 65);
+}
+
+#[test]
+fn test_app_config_concurrent_writes_keep_newest() {
+    let dir = tempdir().unwrap();
+    let mut config = AppConfig::load_from(dir.path());
+    let snapshots: Vec<_> = (0..8)
+        .map(|volume| {
+            config.volume = volume;
+            config.snapshot()
+        })
+        .collect();
+
+    std::thread::scope(|scope| {
+        for snapshot in &snapshots {
+            scope.spawn(|| snapshot.write());
+        }
+    });
+    let loaded = AppConfig::load_from(dir.path());
+    assert_eq!(loaded.volume, 7);
+}
+
 #[test]
 fn test_app_config_get_password() {
     let dir = tempdir().unwrap();
@@ -386,6 +451,23 @@ fn test_app_config_multiple_custom_presets() {
     assert_eq!(config.get_eq_preset("Preset B").unwrap().gains[0], 2.0);
 }
 
+#[test]
+fn test_app_config_overwrite_custom_preset_keeps_position() {
+    let dir = tempdir().unwrap();
+    let mut config = AppConfig::load_from(dir.path());
+
+    config.save_custom_eq_preset("Preset A", &vec![1.0; 18]);
+    config.save_custom_eq_preset("Preset B", &vec![2.0; 18]);
+    let index = config.eq_presets.iter().position(|p| p.name == "Preset A");
+    config.save_custom_eq_preset("Preset A", &vec![5.0; 18]);
+
+    assert_eq!(
+        config.eq_presets.iter().position(|p| p.name == "Preset A"),
+        index
+    );
+    assert_eq!(config.get_eq_preset("Preset A").unwrap().gains[0], 5.0);
+}
+
 #[test]
 fn test_app_config_overwrite_custom_preset() {
     let dir = tempdir().unwrap();
@@ -485,6 +567,60 @@ fn test_app_config_unicode_server_name() {
     assert_eq!(password, "пароль");
 }
 
+#[test]
+fn test_app_config_find_server_case_insensitive() {
+    let dir = tempdir().unwrap();
+    let mut config = AppConfig::load_from(dir.path());
+
+    config.add_server("Home", "https://home.com", "u", "p");
+    config.add_server("Work", "https://work.com", "u", "p");
+
+    assert_eq!(config.find_server("Work"), Some(1));
+    assert_eq!(config.find_server("work"), Some(1));
+    assert_eq!(config.find_server("HOME"), Some(0));
+    assert_eq!(config.find_server("Missing"), None);
+}
+
+#[test]
+fn test_app_config_find_server_after_remove_and_reload() {
+    let dir = tempdir().unwrap();
+    let mut config = AppConfig::load_from(dir.path());
+
+    config.add_server("S1", "https://s1.com", "u", "p");
+    config.add_server("S2", "https://s2.com", "u", "p");
+    config.add_server("S3", "https://s3.com", "u", "p");
+    config.remove_server(0);
+
+    assert_eq!(config.find_server("S1"), None);
+    assert_eq!(config.find_server("S3"), Some(1));
+
+    let config = AppConfig::load_from(dir.path());
+    assert_eq!(config.find_server("s2"), Some(0));
+}
+
+#[test]
+fn test_app_config_find_server_prefers_first_case_variant() {
+    let dir = tempdir().unwrap();
+    let mut config = AppConfig::load_from(dir.path());
+
+    config.add_server("Music", "https://a.com", "u", "p");
+    config.add_server("MUSIC", "https://b.com", "u", "p");
+
+    assert_eq!(config.find_server("music"), Some(0));
+}
+
+#[test]
+fn test_app_config_set_active_server_unchanged_skips_save() {
+    let dir = tempdir().unwrap();
+    let mut config = AppConfig::load_from(dir.path());
+
+    config.add_server("S1", "https://s1.com", "u", "p");
+    std::fs::remove_file(dir.path().join("config.json")).unwrap();
+
+    config.set_active_server(0);
+    assert!(!dir.path().join("config.json").exists());
+}
+
 // ── Config File Corruption & Recovery ───────────────────────────
 
 #[test]
@@ -615,7 +751,7 @@ fn test_server_config_roundtrip() {
         username: "admin".to_string(),
         encrypted_password: "enc123".to_string(),
     };
-    let value = original.to_value();
+    let value = serde_json::to_value(&original).unwrap();
     let restored = ServerConfig::from_value(&value).unwrap();
 
     assert_eq!(original.name, restored.name);
@@ -1,5 +1,5 @@
 use cli_music_player::audio::equalizer_dsp::{EQ_FREQUENCIES, EqualizerDsp};
-use cli_music_player::config::presets::default_eq_presets;
+use cli_music_player::config::presets::{DEFAULT_PRESET_NAMES, default_eq_presets};
 use cli_music_player::equalizer::{EQ_BAND_LABELS, EQ_BANDS, GAIN_MAX, GAIN_MIN};
 
 // ── Constants Tests ─────────────────────────────────────────────
@@ -200,6 +200,13 @@ fn test_preset_names_unique() {
     assert_eq!(names.len(), presets.len());
 }
 
+#[test]
+fn test_default_preset_names_match_presets() {
+    let presets = default_eq_presets();
+    let names: Vec<&str> = presets.iter().map(|p| p.name.as_str()).collect();
+    assert_eq!(names, DEFAULT_PRESET_NAMES);
+}
+
 // ── dB to linear conversion tests ──────────────────────────────
 
 #[test]
@@ -408,6 +415,17 @@ fn test_dsp_odd_sample_count_stereo() {
     assert_eq!(samples.len(), 101);
 }
 
+#[test]
+fn test_dsp_back_to_flat_passes_through() {
+    let mut dsp = EqualizerDsp::new(44100, 2);
+    dsp.set_gains(&[6.0; 18]);
+    dsp.set_gains(&[0.0; 18]);
+
+    let mut samples = vec![0.5f32; 100];
+    dsp.process(&mut samples);
+    assert_eq!(samples, vec![0.5f32; 100]);
+}
+
 #[test]
 fn test_dsp_gains_changed_mid_stream() {
     let mut dsp = EqualizerDsp::new(44100, 1);
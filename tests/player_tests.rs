@@ -1,5 +1,5 @@
 use cli_music_player::audio::pipeline::{
-    AudioCommand, AudioEvent, PlaybackState, convert_channels,
+    AudioCommand, AudioEvent, PRELOAD_MAX_AGE, PlaybackState, convert_channels, preload_due,
 };
 use cli_music_player::config::AppConfig;
 use cli_music_player::equalizer::{EQ_BAND_LABELS, EQ_BANDS, Equalizer, GAIN_MAX, GAIN_MIN};
@@ -785,6 +785,42 @@ fn test_repeat_mode_cycle_is_deterministic() {
     }
 }
 
+// ── Preload Timing Tests ────────────────────────────────────────
+
+/// First position update (sent every tenth of a second) at which the next
+/// track would be preloaded.
+fn preload_start(duration: f64) -> f64 {
+    (0..)
+        .map(|tick| tick as f64 / 10.0)
+        .find(|&pos| preload_due(pos, duration))
+        .unwrap()
+}
+
+#[test]
+fn test_preload_five_minute_track_is_fresh_at_end() {
+    let duration = 300.0;
+    let remaining = duration - preload_start(duration);
+    assert!(remaining > 0.0);
+    assert!(remaining < PRELOAD_MAX_AGE.as_secs_f64());
+}
+
+#[test]
+fn test_preload_long_track_is_fresh_at_end() {
+    let duration = 3600.0;
+    assert!(duration - preload_start(duration) < PRELOAD_MAX_AGE.as_secs_f64());
+}
+
+#[test]
+fn test_preload_short_track_waits_for_second_half() {
+    assert!(!preload_due(10.0, 30.0));
+    assert!(preload_due(15.0, 30.0));
+}
+
+#[test]
+fn test_preload_unknown_duration_never_due() {
+    assert!(!preload_due(100.0, 0.0));
+}
+
 // ── Channel Conversion Tests ────────────────────────────────────
 
 #[test]
@@ -123,6 +123,36 @@ fn test_remove_song() {
     assert_eq!(queue.current_index(), 4); // Adjusted
 }
 
+#[test]
+fn test_contains_tracks_membership() {
+    let mut queue = QueueManager::new();
+    queue.set_queue(make_songs(3), 0);
+    assert!(queue.contains("song1"));
+    assert!(!queue.contains("song3"));
+
+    queue.add(make_songs(4).pop().unwrap());
+    assert!(queue.contains("song3"));
+
+    queue.remove(1);
+    assert!(!queue.contains("song1"));
+
+    queue.clear();
+    assert!(!queue.contains("song0"));
+}
+
+#[test]
+fn test_contains_counts_duplicates() {
+    let mut queue = QueueManager::new();
+    let songs = make_songs(2);
+    queue.set_queue(songs.clone(), 0);
+    queue.add_songs(songs);
+
+    queue.remove(0);
+    assert!(queue.contains("song0"));
+    queue.remove(1);
+    assert!(!queue.contains("song0"));
+}
+
 #[test]
 fn test_remove_current_song() {
     let mut queue = QueueManager::new();
@@ -217,6 +247,29 @@ fn test_next_with_repeat_one() {
     assert_eq!(queue.current_index(), 2);
 }
 
+#[test]
+fn test_peek_next_does_not_advance() {
+    let mut queue = QueueManager::new();
+    queue.set_queue(make_songs(3), 1);
+    assert_eq!(queue.peek_next().unwrap().id, "song2");
+    assert_eq!(queue.current_index(), 1);
+
+    queue.next();
+    assert!(queue.peek_next().is_none());
+    queue.set_repeat(RepeatMode::All);
+    assert_eq!(queue.peek_next().unwrap().id, "song0");
+    queue.set_repeat(RepeatMode::One);
+    assert_eq!(queue.peek_next().unwrap().id, "song2");
+}
+
+#[test]
+fn test_peek_next_unknown_with_shuffle() {
+    let mut queue = QueueManager::new();
+    queue.set_queue(make_songs(5), 0);
+    queue.set_shuffle(true);
+    assert!(queue.peek_next().is_none());
+}
+
 #[test]
 fn test_previous() {
     let mut queue = QueueManager::new();
@@ -506,6 +559,24 @@ fn test_total_duration_single_song() {
     assert_eq!(queue.total_duration(), 300);
 }
 
+#[test]
+fn test_total_duration_tracks_mutations() {
+    let mut queue = QueueManager::new();
+    queue.set_queue(make_songs(3), 0);
+    assert_eq!(queue.total_duration(), 540);
+
+    queue.add_songs(make_songs(2));
+    queue.add_next(make_songs(1).remove(0));
+    assert_eq!(queue.total_duration(), 1080);
+
+    queue.remove(1);
+    queue.toggle_shuffle();
+    assert_eq!(queue.total_duration(), 900);
+
+    queue.clear();
+    assert_eq!(queue.total_duration(), 0);
+}
+
 #[test]
 fn test_remove_out_of_bounds() {
     let mut queue = QueueManager::new();